@@ -0,0 +1,53 @@
+# benchmarks/bench_board_solver.py
+# Boards/sec for the mode2 board solver (full solve, and the early-exit
+# playability check used after every accepted word).
+#
+#   python benchmarks/bench_board_solver.py [n_boards]
+import sys, os, time, random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from systems import board_solver
+from systems.dictionary import WordDictionary, get_dictionary
+
+WIDTH, HEIGHT = 8, 8
+
+
+def _load_dictionary():
+    """The game dictionary if the DB has words, else wordfreq's top 50k."""
+    d = get_dictionary()
+    if len(d):
+        return d, "words table"
+    from wordfreq import top_n_list
+    words = [w.upper() for w in top_n_list("en", 50000) if w.isalpha() and 3 <= len(w) <= 10]
+    return WordDictionary.build((i, w, "", None) for i, w in enumerate(words)), "wordfreq top 50k"
+
+
+def run(n_boards=300):
+    d, source = _load_dictionary()
+    rng = random.Random(42)
+    letter = lambda: chr(rng.randint(65, 90))
+    boards = [[[letter() for _ in range(HEIGHT)] for _ in range(WIDTH)] for _ in range(n_boards)]
+    print(f"dictionary: {len(d):,} words ({source})")
+
+    t = time.perf_counter()
+    total = sum(len(board_solver.solve(b, d)) for b in boards)
+    full = time.perf_counter() - t
+
+    t = time.perf_counter()
+    playable = sum(board_solver.is_playable(b, d) for b in boards)
+    check = time.perf_counter() - t
+
+    t = time.perf_counter()
+    for _ in range(n_boards // 10 or 1):
+        board_solver.make_playable_board(WIDTH, HEIGHT, letter, d, rng=rng)
+    gen = time.perf_counter() - t
+
+    print(f"full solve:        {n_boards / full:8.1f} boards/sec  ({full / n_boards * 1000:6.2f} ms, "
+          f"{total / n_boards:.0f} words/board avg)")
+    print(f"playability check: {n_boards / check:8.1f} boards/sec  ({check / n_boards * 1000:6.2f} ms, "
+          f"{playable}/{n_boards} uniform boards playable)")
+    print(f"playable board gen:{(n_boards // 10 or 1) / gen:8.1f} boards/sec")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,323 @@
+# benchmarks/bench_suite.py
+# Headless benchmark suite: frame drawing, board logic and DB queries, with
+# a stored baseline so regressions fail loudly. Runs on the SDL dummy
+# video/audio drivers with seeded RNGs, so no display is needed.
+#
+#   python benchmarks/bench_suite.py                      run + compare with baseline.json
+#   python benchmarks/bench_suite.py --update-baseline    store this run as the baseline
+#   python benchmarks/bench_suite.py --only mode1 --tolerance 0.2
+#
+# Each benchmark is timed in REPEATS rounds and the best round's ops/sec is
+# compared, so one slow round on a busy machine doesn't fail the run.
+# Exit status is 1 when any benchmark's ops/sec drops more than --tolerance
+# below the baseline.
+import os, sys, time, json, random, string, tempfile, platform, argparse
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+os.chdir(ROOT)          # the modes load assets relative to the repo root
+
+import pygame
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SEED = 1234
+REPEATS = 5             # timed rounds per benchmark; the best one counts
+MIN_SECONDS = 0.1       # per round, after warm-up
+MIN_OPS = 5             # per round
+WARMUP_OPS = 5
+DEFAULT_TOLERANCE = 0.30
+
+
+# ---------- harness ----------
+def _time_round(fn):
+    """Per-call seconds of fn(), until MIN_SECONDS and MIN_OPS are both reached."""
+    times = []
+    start = time.perf_counter()
+    while len(times) < MIN_OPS or time.perf_counter() - start < MIN_SECONDS:
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def measure(benches, repeats=REPEATS):
+    """
+    Time every benchmark of a group in `repeats` interleaved rounds, so a
+    slow spell on a shared machine hits one round of each, not all rounds
+    of one. ops/sec is the best round's; the percentiles cover every call.
+    """
+    for fn in benches.values():
+        for _ in range(WARMUP_OPS):
+            fn()
+    rounds = {name: [] for name in benches}
+    for _ in range(repeats):
+        for name, fn in benches.items():
+            rounds[name].append(_time_round(fn))
+    results = {}
+    for name, runs in rounds.items():
+        times = sorted(t for run in runs for t in run)
+        pick = lambda q: times[min(len(times) - 1, int(q * len(times)))] * 1000
+        results[name] = {"ops_per_sec": max(len(run) / sum(run) for run in runs),
+                         "p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99),
+                         "ops": len(times)}
+    return results
+
+
+def _cycle(items):
+    """Callable returning the next item of `items` on every call."""
+    state = {"i": -1}
+    def next_item():
+        state["i"] = (state["i"] + 1) % len(items)
+        return items[state["i"]]
+    return next_item
+
+
+# ---------- mode1 ----------
+def mode1_benchmarks():
+    from modes import mode1
+    random.seed(SEED)
+    mode1.setup()
+    boards = []
+    for _ in range(50):
+        board = mode1.getBlankBoard()
+        for x in range(mode1.BOARDWIDTH):
+            for y in range(mode1.BOARDHEIGHT):
+                board[x, y] = random.randrange(len(mode1.GEMIMAGES))
+        boards.append(board)
+    board = _cycle(boards)
+    meaning = "a celestial body moving in an elliptical orbit around a star"
+    score = iter(range(10**9))
+
+    return {
+        "mode1._draw_full_frame": lambda: mode1._draw_full_frame(board(), 120, "bench", "PLANET", meaning),
+        "mode1.drawHUD": lambda: mode1.drawHUD("bench", 120, "PLANET", meaning),
+        "mode1.drawHUD (new score)": lambda: mode1.drawHUD("bench", next(score), "PLANET", meaning),
+        "mode1.findMatchingGems": lambda: mode1.findMatchingGems(_rescan(board())),
+        "mode1.canMakeMove": lambda: mode1.canMakeMove(board()),
+        "mode1.getDropSlots": lambda: mode1.getDropSlots(board()),
+        "mode1 cascade logic": lambda: _mode1_cascade(mode1, board().copy()),
+    }
+
+
+def _rescan(board):
+    """The board with its match state dropped, so find_matches() scans it in full."""
+    board.invalidate()
+    return board
+
+
+def _mode1_cascade(mode1, board):
+    """The board logic of resolving one board until stable (what swapAndResolve does, minus drawing)."""
+    matches = mode1.findMatchingGems(board)
+    while matches:
+        for group in matches:
+            for gem in group:
+                board[gem] = mode1.EMPTY_SPACE
+        slots = mode1.getDropSlots(board)
+        while slots != [[]] * mode1.BOARDWIDTH:
+            moving = mode1.getDroppingGems(board)
+            for x in range(len(slots)):
+                if slots[x]:
+                    moving.append(mode1.MovingGem(x, mode1.ROWABOVEBOARD, slots[x].pop(0)))
+            board.apply_moves(moving)
+        matches = mode1.findMatchingGems(board)
+    return mode1.canMakeMove(board)
+
+
+# ---------- board engine ----------
+def board_benchmarks():
+    from systems import gem_board
+    rng = random.Random(SEED)
+    def boards(size, n):
+        return [gem_board.GemBoard(size, size, [rng.randrange(7) for _ in range(size * size)])
+                for _ in range(n)]
+    large = _cycle(boards(24, 20))
+    batch = boards(8, 64)
+    settled = gem_board.GemBoard(24, 24)        # refilled from empty: no runs anywhere
+    for x, col in enumerate(settled.drop_slots(7, rng)):
+        for k, gem in enumerate(col):
+            settled[x, 23 - k] = gem
+    swaps = _cycle([((x, y), (x + 1, y)) for x in range(23) for y in range(0, 24, 5)])
+
+    def swap_and_match(find):
+        a, b = swaps()
+        settled.swap(a, b)
+        find(settled)
+        settled.swap(a, b)
+
+    benches = {
+        "board.find_matches 24x24 (python)": lambda: large().find_matches_py(),
+        "board.can_make_move x64 (python)": lambda: [b.can_make_move_py() for b in batch],
+        "board.swap+match 24x24 (full)": lambda: swap_and_match(gem_board.GemBoard.find_matches_py),
+        "board.swap+match 24x24 (incr.)": lambda: swap_and_match(gem_board.GemBoard.find_matches),
+    }
+    if gem_board.NUMPY_AVAILABLE:
+        grids = gem_board.stack_grids(batch)
+        benches.update({
+            "board.find_matches 24x24 (numpy)": lambda: gem_board.find_matches_np(large()),
+            "board.can_make_moves x64 (numpy)": lambda: gem_board.can_make_moves(grids),
+        })
+    return benches
+
+
+# ---------- mode2 ----------
+def mode2_benchmarks():
+    from modes import mode2
+    random.seed(SEED)
+    mode2.setup()
+    boards = [mode2.make_letter_board() for _ in range(10)]
+    board = _cycle(boards)
+    meaning = "a celestial body moving in an elliptical orbit around a star"
+    score = iter(range(10**9))
+
+    return {
+        "mode2._draw_frame": lambda: mode2._draw_frame(board(), 120, "bench", "PLANET", meaning),
+        "mode2.drawHUD_local": lambda: mode2.drawHUD_local("bench", 120, "PLANET", meaning),
+        "mode2.drawHUD_local (new score)": lambda: mode2.drawHUD_local("bench", next(score), "PLANET", meaning),
+    }
+
+
+# ---------- menus ----------
+def menu_benchmarks():
+    import main
+    labels = _cycle(["Play", "Players", "Leaderboard", "Exit", "SpelloVerse"])
+    return {
+        "main.glow_text": lambda: main.glow_text(labels(), main.MENU_FONT),
+        "main.glow_text (uncached)": lambda: main._render_glow_text(labels(), main.MENU_FONT,
+                                                                     main.WHITE, main.PASTEL_PINK),
+    }
+
+
+# ---------- db ----------
+def _fill_db(db_manager, n_words=20000, n_players=200):
+    rng = random.Random(SEED)
+    seen, rows = set(), []
+    while len(rows) < n_words:
+        w = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 10)))
+        if w not in seen:
+            seen.add(w)
+            rows.append((w, "meaning of " + w, None))
+    db_manager.insert_words_bulk(rows)
+    for i in range(n_players):
+        db_manager.add_player(f"player{i}")
+        db_manager.update_high_score(f"player{i}", rng.randint(0, 5000), mode="mode1")
+        db_manager.update_high_score(f"player{i}", rng.randint(0, 5000), mode="mode2")
+    return sorted(seen)
+
+
+def use_bench_db(tmp):
+    """Point every group at a seeded database in `tmp` (never data/); returns its words."""
+    from systems import db_manager
+    db_manager.set_db_path(os.path.join(tmp, "bench.sqlite3"))
+    return _fill_db(db_manager)
+
+
+def db_benchmarks(words):
+    from systems import db_manager
+    words = _cycle(words)
+    lengths = _cycle(list(range(3, 11)))
+    rng = random.Random(SEED)
+
+    return {
+        "db.get_word_of_length": lambda: db_manager.get_word_of_length(lengths()),
+        "db.get_word_entry": lambda: db_manager.get_word_entry(words()),
+        "db.get_leaderboard": lambda: db_manager.get_leaderboard("mode1"),
+        "db.get_all_players": db_manager.get_all_players,
+        "db.update_high_score": lambda: db_manager.update_high_score(
+            f"player{rng.randrange(200)}", rng.randint(0, 10000), mode="mode1"),
+    }
+
+
+GROUPS = {
+    "mode1": mode1_benchmarks,
+    "board": board_benchmarks,
+    "mode2": mode2_benchmarks,
+    "menu": menu_benchmarks,
+    "db": db_benchmarks,
+}
+
+
+# ---------- baseline ----------
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, "w") as f:
+        json.dump({
+            "environment": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+                "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            },
+            "results": {k: {m: round(v, 4) for m, v in r.items()} for k, r in results.items()},
+        }, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, tolerance):
+    """Names of benchmarks slower than (1 - tolerance) x their baseline ops/sec."""
+    return [name for name, r in results.items()
+            if name in baseline and r["ops_per_sec"] < baseline[name]["ops_per_sec"] * (1 - tolerance)]
+
+
+def run(groups, baseline):
+    results = {}
+    pygame.init()
+    with tempfile.TemporaryDirectory() as tmp:
+        # mode2's dictionary (and its dictionary.bin cache) comes from this DB too
+        words = use_bench_db(tmp)
+        print(f"{'benchmark':<34}{'ops/sec':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'vs base':>10}")
+        for group in groups:
+            benches = GROUPS[group](words) if group == "db" else GROUPS[group]()
+            for name, r in measure(benches).items():
+                results[name] = r
+                base = baseline.get(name)
+                delta = f"{(r['ops_per_sec'] / base['ops_per_sec'] - 1) * 100:+.0f}%" if base else "new"
+                print(f"{name:<34}{r['ops_per_sec']:>12,.0f}{r['p50_ms']:>10.3f}"
+                      f"{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}{delta:>10}")
+        from systems import db_manager
+        db_manager.close_connections()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SpelloVerse headless benchmark suite")
+    parser.add_argument("--only", action="append", choices=sorted(GROUPS),
+                        help="run only this group (repeatable)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed ops/sec drop vs baseline (default 0.30)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results = run(args.only or list(GROUPS), baseline)
+
+    if args.update_baseline:
+        merged = dict(baseline, **results)
+        save_baseline(merged, args.baseline)
+        print("Baseline written to", args.baseline)
+        return 0
+
+    if not baseline:
+        print("\nNo baseline yet; store one with --update-baseline.")
+        return 0
+    slower = compare(results, baseline, args.tolerance)
+    if slower:
+        print(f"\nREGRESSION: {len(slower)} benchmark(s) more than "
+              f"{args.tolerance:.0%} slower than baseline:")
+        for name in slower:
+            print(f"  {name}: {results[name]['ops_per_sec']:,.0f} ops/sec "
+                  f"(baseline {baseline[name]['ops_per_sec']:,.0f})")
+        return 1
+    print("\nOK: no regressions against", os.path.relpath(args.baseline))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# benchmarks/bench_word_sampler.py
+# Compare the old ORDER BY RANDOM() query with the in-memory WordSampler.
+#
+#   python benchmarks/bench_word_sampler.py            (100k and 1M words)
+#   python benchmarks/bench_word_sampler.py 50000      (custom sizes)
+import sys, os, time, random, string, tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from systems import db_manager
+
+PICKS = 200
+
+
+def _fill(n_words):
+    rng = random.Random(1234)
+    seen = set()
+    rows = []
+    while len(rows) < n_words:
+        w = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 10)))
+        if w in seen:
+            continue
+        seen.add(w)
+        rows.append((w, "meaning of " + w, None, len(w)))
+    with db_manager.transaction() as conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO words (word, meaning, audio_path, length) VALUES (?, ?, ?, ?)",
+            rows)
+
+
+def _old_query(length):
+    with db_manager.connection() as conn:
+        row = conn.execute(
+            "SELECT * FROM words WHERE length=? ORDER BY RANDOM() LIMIT 1", (length,)).fetchone()
+    return dict(row) if row else None
+
+
+def _time(fn, n):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(3 + i % 8)
+    return (time.perf_counter() - start) / n * 1e6   # µs per pick
+
+
+def run(n_words):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager.set_db_path(os.path.join(tmp, "bench.sqlite3"))
+        _fill(n_words)
+
+        old_us = _time(_old_query, PICKS)
+
+        t0 = time.perf_counter()
+        for length in range(3, 11):
+            db_manager._sampler.bucket_size(length)
+        warm_ms = (time.perf_counter() - t0) * 1000
+
+        new_us = _time(db_manager.get_word_of_length, PICKS * 10)
+        bag_us = _time(lambda L: db_manager.get_word_of_length(L, no_repeat=True), PICKS * 10)
+
+        print(f"{n_words:>9,} words | ORDER BY RANDOM(): {old_us:9.1f} µs/pick"
+              f" | sampler: {new_us:6.1f} µs/pick | shuffle bag: {bag_us:6.1f} µs/pick"
+              f" | bucket load: {warm_ms:7.1f} ms | speedup x{old_us / new_us:,.0f}")
+        db_manager.close_connections()
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in sizes:
+        run(n)
@@ -1,14 +1,27 @@
 # data/generate_word_dataset.py
-import sys, os
+import sys, os, gzip, csv, itertools, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from systems import db_manager
-from wordfreq import top_n_list
-from nltk.corpus import wordnet as wn
 
+# (word, meaning, length) rows extracted from NLTK, cached so rebuilds skip NLTK
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "word_cache.tsv.gz")
+SHARD_SIZE = 2000          # words per worker task, and rows per committed batch
+BUILD_STATE_KEY = "dataset_build"
+NO_MEANING = "Meaning not available."
 
-def build_dataset():
-    print("Building full English word list…")
+
+def is_clean(w):
+    return (
+        w.isalpha() and len(w) >= 3 and len(w) <= 10
+    )
+
+
+def source_words():
+    """Stage 1 (source): raw wordfreq top 20k + WordNet lemma names."""
+    from wordfreq import top_n_list
+    from nltk.corpus import wordnet as wn
 
     # wordfreq 20k
     freq_words = top_n_list("en", 20000)
@@ -19,31 +32,164 @@ def build_dataset():
         for lemma in syn.lemmas():
             wn_words.add(lemma.name())
 
-    raw = set(freq_words) | wn_words
+    return set(freq_words) | wn_words
+
+
+def clean_words(raw):
+    """Stage 2 (clean): lowercase, de-duplicated, sorted so shards are stable across runs."""
+    return sorted({w.lower() for w in raw if is_clean(w)})
+
+
+def define_shard(words):
+    """Worker: first WordNet definition for each word of the shard."""
+    from nltk.corpus import wordnet as wn
+    out = []
+    for w in words:
+        syns = wn.synsets(w)
+        out.append((w.upper(), syns[0].definition() if syns else NO_MEANING, len(w)))
+    return out
+
+
+def define_words(words, workers=None, cache_path=None, cache_prefix=()):
+    """
+    Stage 3 (define): yield (word, meaning, length) rows in input order.
+    Definitions are resolved by a process pool, one shard per task, and
+    streamed back here (the single writer). With cache_path the rows are
+    also written to the on-disk cache, which only becomes visible once
+    every shard has been written. cache_prefix holds rows defined by an
+    earlier, interrupted build; they go to the cache ahead of the new rows.
+    Workers are spawned, not forked: the caller is a multithreaded pygame
+    process, and a forked child can deadlock on a lock held by another thread.
+    """
+    shards = [words[i:i + SHARD_SIZE] for i in range(0, len(words), SHARD_SIZE)]
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    cache_file = gzip.open(cache_path + ".tmp", "wt", encoding="utf-8", newline="") if cache_path else None
+    cache = csv.writer(cache_file, delimiter="\t") if cache_file else None
+    if cache:
+        cache.writerows(cache_prefix)
+    try:
+        for rows in pool.map(define_shard, shards):
+            if cache:
+                cache.writerows(rows)
+            yield from rows
+    finally:
+        # a cancelled build must not wait for the remaining shards
+        pool.shutdown(wait=False, cancel_futures=True)
+        if cache_file:
+            cache_file.close()
+    if cache_path:
+        os.replace(cache_path + ".tmp", cache_path)
+
+
+def read_cache(cache_path=CACHE_PATH):
+    with gzip.open(cache_path, "rt", encoding="utf-8", newline="") as f:
+        for word, meaning, length in csv.reader(f, delimiter="\t"):
+            yield word, meaning, int(length)
+
+
+def _count_cache(cache_path):
+    with gzip.open(cache_path, "rt", encoding="utf-8", newline="") as f:
+        return sum(1 for _ in csv.reader(f, delimiter="\t"))
+
+
+def _salvage_cache(cache_path, words):
+    """
+    Rows for `words` from the partial cache an interrupted build left at
+    cache_path + ".tmp", or None if it doesn't cover them all.
+    """
+    rows = []
+    try:
+        for row in read_cache(cache_path + ".tmp"):
+            if len(rows) == len(words):
+                break
+            rows.append(row)
+    except (OSError, EOFError, ValueError, csv.Error):
+        pass      # missing, or cut short by a crash: keep what was readable
+    if [word for word, _, _ in rows] != [w.upper() for w in words]:
+        return None
+    return rows
+
+
+# ---------- build state ----------
+def build_state():
+    """None (never built / pre-checkpoint DB), "done", or rows committed so far."""
+    state = db_manager.get_meta(BUILD_STATE_KEY)
+    if state is None or state == "done":
+        return state
+    return int(state)
+
+def build_pending():
+    """True when a previous build stopped part-way and should be resumed."""
+    return isinstance(build_state(), int)
+
+
+def build_dataset(progress_callback=None, cancel_event=None, workers=None, cache_path=CACHE_PATH):
+    """
+    Streaming pipeline: source -> clean -> define -> write.
+
+    Rows are committed in SHARD_SIZE batches together with a checkpoint, so
+    a crash or a closed window resumes from the last committed batch.
+    progress_callback(stage, done, total) reports real progress;
+    setting cancel_event stops after the current batch.
+    Returns True when the dataset is complete, False if cancelled.
+    """
+    report = progress_callback or (lambda stage, done, total: None)
+    cancelled = lambda: cancel_event is not None and cancel_event.is_set()
+
+    state = build_state()
+    resume_from = state if isinstance(state, int) else 0
+    print("Building full English word list…" if not resume_from
+          else f"Resuming word list build at row {resume_from}…")
 
-    def is_clean(w):
-        return (
-            w.isalpha() and len(w) >= 3 and len(w) <= 10
-        )
+    if os.path.exists(cache_path):
+        # cached define output: NLTK is never imported
+        report("source", 0, 0)
+        total = _count_cache(cache_path)
+        rows = itertools.islice(read_cache(cache_path), resume_from, None)
+    else:
+        report("source", 0, 0)
+        raw = source_words()
+        report("clean", 0, 0)
+        words = clean_words(raw)
+        total = len(words)
+        print(f"Clean words: {total}")
+        # a resumed build completes the cache from the rows the interrupted
+        # one already defined; without them it can't, so drop the leftover
+        prefix = _salvage_cache(cache_path, words[:resume_from]) if resume_from else []
+        if prefix is None:
+            try:
+                os.remove(cache_path + ".tmp")
+            except OSError:
+                pass
+        rows = define_words(words[resume_from:], workers,
+                            cache_path if prefix is not None else None, prefix or ())
+    report("define", resume_from, total)
 
-    clean_words = [w.lower() for w in raw if is_clean(w)]
-    clean_words = list(set(clean_words))
+    def stream():
+        for word, meaning, _ in rows:
+            if cancelled():
+                return
+            yield word, meaning, None
 
-    print(f"Clean words: {len(clean_words)}")
+    def checkpoint(seen):
+        db_manager.set_meta(BUILD_STATE_KEY, resume_from + seen)
 
-    def meaning(word):
-        syns = wn.synsets(word)
-        if syns:
-            return syns[0].definition()
-        return "Meaning not available."
+    stats = db_manager.insert_words_bulk(
+        stream(), chunk_size=SHARD_SIZE, checkpoint=checkpoint,
+        progress_callback=lambda seen: report("write", resume_from + seen, total))
+    if hasattr(rows, "close"):
+        rows.close()      # stops the worker pool if we were cancelled
 
-    count = 0
-    for w in clean_words:
-        db_manager.insert_word(w.upper(), meaning(w), None)
-        count += 1
+    print(f"Inserted {stats['rows']} words in {stats['seconds']:.1f}s "
+          f"({stats['rows_per_sec']:,.0f} rows/sec).")
+    if cancelled():
+        print("Word list build paused; it will resume on the next launch.")
+        return False
 
-    print(f"Inserted {count} words.")
+    db_manager.set_meta(BUILD_STATE_KEY, "done")
+    report("done", total, total)
     print("Final DB total:", db_manager.count_words())
+    return True
 
 
 if __name__ == "__main__":
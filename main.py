@@ -1,16 +1,16 @@
 # main.py — SpelloVerse Main Menu
-import sys, os, threading
+import sys, os, threading, multiprocessing
 sys.path.append(os.path.dirname(__file__))
 
+if __name__ == "__main__":
+    multiprocessing.freeze_support()   # pool workers of the frozen EXE stop here
+
 import pygame, time
+from collections import OrderedDict
 from pygame.locals import *
-from systems import db_manager
-
-# PyInstaller-friendly asset path
-def resource_path(relative_path):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return relative_path
+from systems import db_manager, score_writer
+from systems import profiler, assets
+from systems.scenes import Scene, SceneManager
 
 # Window + visuals
 WINDOWWIDTH, WINDOWHEIGHT = 900, 820
@@ -20,8 +20,24 @@ WHITE = (255,255,255)
 PASTEL_PINK = (245,180,215)
 CYAN = (150,190,255)
 
-# Simple glow text effect
+# Simple glow text effect, memoized: menus redraw the same labels every frame
+GLOW_CACHE_SIZE = 256
+_GLOW_CACHE = OrderedDict()
+
 def glow_text(text, font, base_color=WHITE, glow_color=PASTEL_PINK):
+    """Cached glow surface for (text, font, colors). Shared — blit it, never draw on it."""
+    key = (text, font, tuple(base_color), tuple(glow_color))
+    surf = _GLOW_CACHE.get(key)
+    if surf is not None:
+        _GLOW_CACHE.move_to_end(key)
+        return surf
+    surf = _render_glow_text(text, font, base_color, glow_color)
+    _GLOW_CACHE[key] = surf
+    if len(_GLOW_CACHE) > GLOW_CACHE_SIZE:
+        _GLOW_CACHE.popitem(last=False)
+    return surf
+
+def _render_glow_text(text, font, base_color, glow_color):
     main = font.render(text, True, base_color)
     glow = font.render(text, True, glow_color)
     w, h = main.get_size()
@@ -32,25 +48,39 @@ def glow_text(text, font, base_color=WHITE, glow_color=PASTEL_PINK):
     surf.blit(main, (4,4))
     return surf
 
-# Pygame setup
-pygame.init()
-DISPLAYSURF = pygame.display.set_mode((WINDOWWIDTH, WINDOWHEIGHT))
-pygame.display.set_caption("SpelloVerse")
-CLOCK = pygame.time.Clock()
-
-# Fonts
-TITLE_FONT = pygame.font.Font("freesansbold.ttf", 54)
-MENU_FONT  = pygame.font.Font("freesansbold.ttf", 40)
-INPUT_FONT = pygame.font.Font("freesansbold.ttf", 32)
-SMALL_FONT = pygame.font.Font("freesansbold.ttf", 20)
-
-# Background
-try:
-    SPACE_BG = pygame.image.load(resource_path("assets/bg/space.png"))
-    SPACE_BG = pygame.transform.scale(SPACE_BG, (WINDOWWIDTH, WINDOWHEIGHT))
-except Exception:
-    SPACE_BG = pygame.Surface((WINDOWWIDTH, WINDOWHEIGHT))
-    SPACE_BG.fill((10,10,20))
+# Menu hit-testing: rects are computed once per menu, not re-rendered per click
+def menu_hit_rects(options, font, start_y, gap):
+    """Click rect of each option, centred like the labels drawn by the menus."""
+    rects = []
+    for i, text in enumerate(options):
+        rect = pygame.Rect((0, 0), font.size(text))
+        rect.center = (WINDOWWIDTH//2, start_y + i*gap)
+        rects.append(rect)
+    return rects
+
+def option_at(rects, pos):
+    """Index of the option under `pos`, or None."""
+    for i, rect in enumerate(rects):
+        if rect.collidepoint(pos):
+            return i
+    return None
+
+# Dataset-builder pool workers re-import this script as __mp_main__ on spawn
+# platforms (Windows, frozen EXE); they must not open a game window.
+if __name__ != "__mp_main__":
+    # One pygame session, window and clock shared by every menu and mode
+    SCENES = SceneManager((WINDOWWIDTH, WINDOWHEIGHT), "SpelloVerse")
+    DISPLAYSURF = SCENES.display
+
+    # Fonts
+    TITLE_FONT = pygame.font.Font("freesansbold.ttf", 54)
+    MENU_FONT  = pygame.font.Font("freesansbold.ttf", 40)
+    INPUT_FONT = pygame.font.Font("freesansbold.ttf", 32)
+    SMALL_FONT = pygame.font.Font("freesansbold.ttf", 20)
+
+    # Background (shared with the modes, already in display format)
+    SPACE_BG = assets.image("assets/bg/space.png", (WINDOWWIDTH, WINDOWHEIGHT), smooth=False,
+                            fallback=(10,10,20))
 
 # ---- Dataset handling ----
 def _count_words_safe():
@@ -59,17 +89,32 @@ def _count_words_safe():
     except:
         return 0
 
-def _build_dataset_safe(progress_callback=None):
+def _build_dataset_safe(progress_callback=None, cancel_event=None):
     try:
         from data.generate_word_dataset import build_dataset
-    except Exception:
+    except Exception as e:
+        print("Dataset builder unavailable:", e)
+        return False
+    try:
+        return build_dataset(progress_callback=progress_callback, cancel_event=cancel_event)
+    except Exception as e:
+        print("Dataset build failed:", e)
         return False
+
+def _dataset_build_pending():
     try:
-        build_dataset(progress_callback=progress_callback)
-        return True
+        from data.generate_word_dataset import build_pending
+        return build_pending()
     except Exception:
         return False
 
+# Game assets are decoded in the background while the loading screen runs,
+# so the first launch of each mode does not wait on disk or decoding
+def _preload_game_assets():
+    from modes import mode1, mode2
+    mode1.load_assets()
+    mode2.load_assets()
+
 # Small loading animation
 def _play_quick_loading_animation(duration_ms=700):
     dots = ["", ".", "..", "...", "....", "....."]
@@ -93,31 +138,64 @@ def _play_quick_loading_animation(duration_ms=700):
         pygame.time.delay(110)
 
 # Animated DB builder
+BUILD_STAGE_TEXT = {
+    "source": "Gathering words from the galaxy",
+    "clean": "Polishing words",
+    "define": "Looking up meanings",
+    "write": "Storing words",
+    "done": "Words ready",
+}
+
 def _run_live_build_with_animation():
     done = {"val": False}
+    progress = {"stage": "source", "done": 0, "total": 0}
+    cancel = threading.Event()
+
+    def on_progress(stage, count, total):
+        progress.update(stage=stage, done=count, total=total)
 
     def worker():
-        _build_dataset_safe()
+        _build_dataset_safe(on_progress, cancel)
         done["val"] = True
 
-    threading.Thread(target=worker, daemon=True).start()
+    builder = threading.Thread(target=worker, daemon=True)
+    builder.start()
 
     dots = ["", ".", "..", "...", "....", "....."]
     idx = 0
     font = pygame.font.Font("freesansbold.ttf", 34)
+    bar = pygame.Rect(WINDOWWIDTH//2 - 220, WINDOWHEIGHT//2 + 50, 440, 16)
 
     while not done["val"]:
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                # stop after the current batch; the build resumes next launch
+                cancel.set()
+                builder.join(timeout=10)
+                score_writer.shutdown(); pygame.quit(); sys.exit()
+
         DISPLAYSURF.blit(SPACE_BG, (0,0))
         msg = f"Floating through galaxies to fetch words{dots[idx]}"
         txt = glow_text(msg, font)
         DISPLAYSURF.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT//2)))
 
-        for i in range(6):
-            pygame.draw.circle(
-                DISPLAYSURF, (200,200,255),
-                (WINDOWWIDTH//2 - 60 + i*20, WINDOWHEIGHT//2 + 60),
-                2 + (idx % 2)
-            )
+        total = progress["total"]
+        if total:
+            frac = min(1.0, progress["done"] / total)
+            pygame.draw.rect(DISPLAYSURF, (40,40,70), bar, border_radius=8)
+            pygame.draw.rect(DISPLAYSURF, (200,200,255),
+                             (bar.x, bar.y, int(bar.w * frac), bar.h), border_radius=8)
+            label = f"{BUILD_STAGE_TEXT.get(progress['stage'], '')} — {progress['done']:,} / {total:,}"
+        else:
+            for i in range(6):
+                pygame.draw.circle(
+                    DISPLAYSURF, (200,200,255),
+                    (WINDOWWIDTH//2 - 60 + i*20, WINDOWHEIGHT//2 + 60),
+                    2 + (idx % 2)
+                )
+            label = BUILD_STAGE_TEXT.get(progress["stage"], "")
+        sub = glow_text(label, SMALL_FONT, base_color=CYAN)
+        DISPLAYSURF.blit(sub, sub.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT//2 + 100)))
 
         pygame.display.update()
         idx = (idx + 1) % len(dots)
@@ -127,131 +205,147 @@ def _run_live_build_with_animation():
 
 def ensure_word_dataset():
     count = _count_words_safe()
-    if count > 0:
+    if count > 0 and not _dataset_build_pending():
         _play_quick_loading_animation(700)
         return
     _run_live_build_with_animation()
 
-# ---- Main Menu ----
+# ---- Menu scenes ----
 CURRENT_PLAYER = None
 
-def main_menu():
-    global CURRENT_PLAYER
-    options = ["Play", "Players", "Leaderboard", "Exit"]
-    selected = 0
+class MenuScene(Scene):
+    """Menu screen: drawn and flipped only when what it shows changed."""
+    fps = FPS
+    caption = "SpelloVerse"
+
+    def shown(self):
+        """Everything the frame depends on; a new value triggers a redraw."""
+        return ()
+
+    def draw_menu(self, surface):
+        pass
+
+    def draw(self, surface):
+        if self.pacer.changed(profiler.overlay_state()[0], *self.shown()):
+            surface.blit(SPACE_BG, (0,0))
+            self.draw_menu(surface)
+            profiler.draw_overlay(surface)
+            with profiler.scope("flip"):
+                pygame.display.update()
+
+class OptionMenuScene(MenuScene):
+    """Vertical list of options: up / down + ENTER, or a mouse click."""
+    options = ()
     start_y = 260; gap = 70
 
-    while True:
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
+    def enter(self):
+        self.selected = 0
+        self.hit_rects = menu_hit_rects(self.options, MENU_FONT, self.start_y, self.gap)
+
+    def choose(self, i):
+        pass
+
+    def shown(self):
+        return (self.selected,)
+
+    def handle_event(self, event):
+        if event.type == KEYDOWN:
+            if event.key == K_UP:
+                self.selected = (self.selected - 1) % len(self.options)
+            elif event.key == K_DOWN:
+                self.selected = (self.selected + 1) % len(self.options)
+            elif event.key == K_RETURN:
+                self.choose(self.selected)
+        if event.type == MOUSEBUTTONUP:
+            i = option_at(self.hit_rects, event.pos)
+            if i is not None:
+                self.choose(i)
+
+    def draw_options(self, surface):
+        for i, text in enumerate(self.options):
+            color = WHITE if i == self.selected else CYAN
+            surf = glow_text(text, MENU_FONT, base_color=color)
+            surface.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, self.start_y + i*self.gap)))
+
+# ---- Main Menu ----
+class MainMenuScene(OptionMenuScene):
+    name = "main menu"
+    options = ["Play", "Players", "Leaderboard", "Exit"]
+
+    def choose(self, i):
+        if i == 0: self.manager.push(ModeSelectScene())
+        elif i == 1: self.manager.push(PlayerManagerScene())
+        elif i == 2: self.manager.push(LeaderboardScene())
+        elif i == 3: self.manager.quit()
+
+    def shown(self):
+        return (self.selected, CURRENT_PLAYER)
 
+    def preload(self):
+        return (_preload_game_assets,)
+
+    def draw_menu(self, surface):
         title_surf = glow_text("SpelloVerse", TITLE_FONT)
-        DISPLAYSURF.blit(title_surf, title_surf.get_rect(center=(WINDOWWIDTH//2, 120)))
+        surface.blit(title_surf, title_surf.get_rect(center=(WINDOWWIDTH//2, 120)))
 
         cur_text = f"Current: {CURRENT_PLAYER}" if CURRENT_PLAYER else "Current: (none)"
         cur_surf = glow_text(cur_text, SMALL_FONT)
-        DISPLAYSURF.blit(cur_surf, cur_surf.get_rect(topright=(WINDOWWIDTH - 28, 20)))
+        surface.blit(cur_surf, cur_surf.get_rect(topright=(WINDOWWIDTH - 28, 20)))
 
-        for i, text in enumerate(options):
-            color = WHITE if i == selected else CYAN
-            surf = glow_text(text, MENU_FONT, base_color=color)
-            DISPLAYSURF.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap)))
+        self.draw_options(surface)
 
         hint = glow_text("Use up / down • ENTER to choose • Mouse supported", SMALL_FONT)
-        DISPLAYSURF.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 50)))
-
-        pygame.display.update()
-        CLOCK.tick(FPS)
-
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit(); sys.exit()
-
-            if event.type == KEYDOWN:
-                if event.key == K_UP:
-                    selected = (selected - 1) % len(options)
-                elif event.key == K_DOWN:
-                    selected = (selected + 1) % len(options)
-                elif event.key == K_RETURN:
-                    if selected == 0: mode_select_screen()
-                    elif selected == 1: player_manager_screen()
-                    elif selected == 2: leaderboard_screen()
-                    elif selected == 3: pygame.quit(); sys.exit()
-
-            if event.type == MOUSEBUTTONUP:
-                mx,my = event.pos
-                for i in range(len(options)):
-                    surf = MENU_FONT.render(options[i], True, WHITE)
-                    rect = surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap))
-                    if rect.collidepoint(mx,my):
-                        if i == 0: mode_select_screen()
-                        elif i == 1: player_manager_screen()
-                        elif i == 2: leaderboard_screen()
-                        elif i == 3: pygame.quit(); sys.exit()
+        surface.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 50)))
 
 # ---- Mode Selection ----
-def mode_select_screen():
+class ModeSelectScene(OptionMenuScene):
+    name = "mode select"
     options = ["Mode 1 — Gem Reveal", "Mode 2 — Trail Spell", "Back"]
-    selected = 0
-    start_y = 260; gap = 70
 
-    while True:
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
+    def choose(self, i):
+        if i == 0: _start_mode(self.manager, "mode1")
+        elif i == 1: _start_mode(self.manager, "mode2")
+        elif i == 2: self.manager.pop(self)
+
+    def handle_event(self, event):
+        if event.type == KEYDOWN and event.key == K_ESCAPE:
+            self.manager.pop(self)
+            return
+        super().handle_event(event)
+
+    def draw_menu(self, surface):
         title = glow_text("Choose a Mode", TITLE_FONT)
-        DISPLAYSURF.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 140)))
+        surface.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 140)))
 
-        for i, t in enumerate(options):
-            color = WHITE if i == selected else CYAN
-            surf = glow_text(t, MENU_FONT, base_color=color)
-            DISPLAYSURF.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap)))
+        self.draw_options(surface)
 
         hint = glow_text("up / down • ENTER select • ESC back", SMALL_FONT, base_color=CYAN)
-        DISPLAYSURF.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 70)))
+        surface.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 70)))
 
-        pygame.display.update()
-        CLOCK.tick(FPS)
-
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                return
-            if event.type == KEYDOWN:
-                if event.key == K_UP:
-                    selected = (selected - 1) % len(options)
-                elif event.key == K_DOWN:
-                    selected = (selected + 1) % len(options)
-                elif event.key == K_RETURN:
-                    if selected == 0: _start_mode("mode1")
-                    elif selected == 1: _start_mode("mode2")
-                    elif selected == 2: return
-                elif event.key == K_ESCAPE:
-                    return
-            if event.type == MOUSEBUTTONUP:
-                mx,my = event.pos
-                for i in range(len(options)):
-                    surf = MENU_FONT.render(options[i], True, WHITE)
-                    rect = surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap))
-                    if rect.collidepoint(mx,my):
-                        if i == 0: _start_mode("mode1")
-                        elif i == 1: _start_mode("mode2")
-                        elif i == 2: return
-
-def _start_mode(mode_name):
-    global CURRENT_PLAYER
+def _start_mode(manager, mode_name):
+    """Push the mode's scene, asking for a player first if none is chosen yet."""
     if CURRENT_PLAYER is None:
-        picked = select_player_screen()
-        if not picked:
+        if not _safe_get_players():
+            manager.push(NoPlayersScene())
             return
-        CURRENT_PLAYER = picked
+        manager.push(SelectPlayerScene(on_pick=lambda name: _play_as(manager, name, mode_name)))
+        return
 
     try:
         if mode_name == "mode1":
             from modes import mode1
-            mode1.main(CURRENT_PLAYER)
+            manager.push(mode1.Mode1Scene(CURRENT_PLAYER))
         elif mode_name == "mode2":
             from modes import mode2
-            mode2.main(CURRENT_PLAYER)
+            manager.push(mode2.Mode2Scene(CURRENT_PLAYER))
     except Exception as e:
         print("Failed launching mode:", e)
 
+def _play_as(manager, name, mode_name):
+    global CURRENT_PLAYER
+    CURRENT_PLAYER = name
+    _start_mode(manager, mode_name)
+
 # ---- Player Selection + Manager ----
 def _safe_get_players():
     try:
@@ -270,202 +364,221 @@ def _safe_get_players():
     except:
         return []
 
-def select_player_screen():
-    players = _safe_get_players()
-    if not players:
-        prompt_no_players()
-        return None
-
-    selected = 0
+class SelectPlayerScene(MenuScene):
+    """Pick a player, then on_pick(name) runs with this scene already popped."""
+    name = "select player"
     start_y = 240; gap = 56
 
-    while True:
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
+    def __init__(self, on_pick):
+        super().__init__()
+        self.on_pick = on_pick
+
+    def enter(self):
+        self.selected = 0
+        self.players = _safe_get_players()
+
+    def resume(self):
+        super().resume()
+        # back from Add Player
+        self.players = _safe_get_players()
+        self.selected = min(self.selected, max(0, len(self.players)-1))
+
+    def shown(self):
+        return (self.selected, tuple(p["name"] for p in self.players))
+
+    def handle_event(self, event):
+        if event.type != KEYDOWN:
+            return
+        players = self.players
+        if event.key == K_UP and players:
+            self.selected = (self.selected - 1) % len(players)
+        elif event.key == K_DOWN and players:
+            self.selected = (self.selected + 1) % len(players)
+        elif event.key == K_RETURN and players:
+            self.manager.pop(self)
+            self.on_pick(players[self.selected]["name"])
+        elif event.key == K_a:
+            self.manager.push(AddPlayerScene())
+        elif event.key == K_d and players:
+            db_manager.delete_player(players[self.selected]["name"])
+            self.players = _safe_get_players()
+            if not self.players:
+                self.manager.replace(self, NoPlayersScene())
+                return
+            self.selected = min(self.selected, len(self.players)-1)
+        elif event.key == K_ESCAPE:
+            self.manager.pop(self)
+
+    def draw_menu(self, surface):
         title = glow_text("Select Player", TITLE_FONT)
-        DISPLAYSURF.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
+        surface.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
 
-        for i,p in enumerate(players):
-            color = WHITE if i==selected else CYAN
+        for i,p in enumerate(self.players):
+            color = WHITE if i==self.selected else CYAN
             surf = glow_text(p["name"], MENU_FONT, base_color=color)
-            DISPLAYSURF.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap)))
+            surface.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, self.start_y + i*self.gap)))
 
         hint = glow_text("ENTER select • A add • D delete • ESC back", SMALL_FONT, base_color=CYAN)
-        DISPLAYSURF.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 50)))
+        surface.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 50)))
 
-        pygame.display.update()
-        CLOCK.tick(FPS)
+class PlayerManagerScene(MenuScene):
+    name = "player manager"
+    start_y = 240; gap = 52
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                return None
-            if event.type == KEYDOWN:
-                if event.key == K_UP:
-                    selected = (selected - 1) % len(players)
-                elif event.key == K_DOWN:
-                    selected = (selected + 1) % len(players)
-                elif event.key == K_RETURN:
-                    return players[selected]["name"]
-                elif event.key == K_a:
-                    add_player_screen()
-                    players = _safe_get_players()
-                    selected = min(selected, max(0, len(players)-1))
-                elif event.key == K_d:
-                    name = players[selected]["name"]
-                    db_manager.delete_player(name)
-                    players = _safe_get_players()
-                    if not players:
-                        prompt_no_players()
-                        return None
-                    selected = min(selected, len(players)-1)
-                elif event.key == K_ESCAPE:
-                    return None
-
-def player_manager_screen():
-    global CURRENT_PLAYER
-    selected = 0
+    def enter(self):
+        self.selected = 0
+        self.players = _safe_get_players()   # re-queried only after add / delete
 
-    while True:
-        players = _safe_get_players()
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
+    def resume(self):
+        super().resume()
+        # back from Add Player
+        self.players = _safe_get_players()
+
+    def shown(self):
+        return (self.selected, CURRENT_PLAYER, tuple(p["name"] for p in self.players))
+
+    def handle_event(self, event):
+        global CURRENT_PLAYER
+        if event.type != KEYDOWN:
+            return
+        players = self.players
+        if event.key == K_UP and players:
+            self.selected = (self.selected - 1) % len(players)
+        elif event.key == K_DOWN and players:
+            self.selected = (self.selected + 1) % len(players)
+        elif event.key == K_RETURN and players:
+            CURRENT_PLAYER = players[self.selected]["name"]
+            self.manager.pop(self)
+        elif event.key == K_a:
+            self.manager.push(AddPlayerScene())
+        elif event.key == K_d and players:
+            db_manager.delete_player(players[self.selected]["name"])
+            self.players = _safe_get_players()
+            self.selected = min(self.selected, max(0, len(self.players)-1))
+        elif event.key == K_ESCAPE:
+            self.manager.pop(self)
+
+    def draw_menu(self, surface):
         title = glow_text("Player Manager", TITLE_FONT)
-        DISPLAYSURF.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
+        surface.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
 
-        if not players:
+        if not self.players:
             txt = glow_text("No players yet. Press A to add.", MENU_FONT)
-            DISPLAYSURF.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, 380)))
+            surface.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, 380)))
         else:
-            start_y = 240; gap = 52
-            for i,p in enumerate(players):
+            for i,p in enumerate(self.players):
                 label = p["name"]
                 if CURRENT_PLAYER == p["name"]:
                     label = f"{label}  (current)"
-                color = WHITE if i==selected else CYAN
+                color = WHITE if i==self.selected else CYAN
                 surf = glow_text(label, MENU_FONT, base_color=color)
-                DISPLAYSURF.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap)))
+                surface.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, self.start_y + i*self.gap)))
 
         hint = glow_text("ENTER select • A add • D delete • ESC back", SMALL_FONT, base_color=CYAN)
-        DISPLAYSURF.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 50)))
+        surface.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 50)))
 
-        pygame.display.update()
-        CLOCK.tick(FPS)
+class AddPlayerScene(MenuScene):
+    name = "add player"
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                return
-            if event.type == KEYDOWN:
-                players = _safe_get_players()
-                if event.key == K_UP and players:
-                    selected = (selected - 1) % len(players)
-                elif event.key == K_DOWN and players:
-                    selected = (selected + 1) % len(players)
-                elif event.key == K_RETURN and players:
-                    CURRENT_PLAYER = players[selected]["name"]
-                    return
-                elif event.key == K_a:
-                    add_player_screen()
-                elif event.key == K_d and players:
-                    db_manager.delete_player(players[selected]["name"])
-                elif event.key == K_ESCAPE:
-                    return
-
-def add_player_screen():
-    name = ""
-    cursor = True
-    tick = 0
-
-    while True:
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
+    def enter(self):
+        self.name_text = ""
+
+    def cursor(self):
+        return (pygame.time.get_ticks() // 500) % 2 == 0   # blink on the clock, not the frame count
+
+    def shown(self):
+        return (self.name_text, self.cursor())
+
+    def handle_event(self, event):
+        if event.type != KEYDOWN:
+            return
+        if event.key == K_RETURN and self.name_text.strip():
+            db_manager.add_player(self.name_text.strip())
+            self.manager.pop(self)
+        elif event.key == K_BACKSPACE:
+            self.name_text = self.name_text[:-1]
+        elif event.key == K_ESCAPE:
+            self.manager.pop(self)
+        else:
+            if len(self.name_text) < 20 and event.unicode.isprintable():
+                self.name_text += event.unicode
+
+    def draw_menu(self, surface):
         title = glow_text("New Player Name", TITLE_FONT)
-        DISPLAYSURF.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
+        surface.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
 
         box_rect = pygame.Rect(WINDOWWIDTH//2 - 260, 300, 520, 64)
         box_surf = pygame.Surface((box_rect.w, box_rect.h), pygame.SRCALPHA)
         pygame.draw.rect(box_surf, (20,20,30,200), (0,0,box_rect.w, box_rect.h), border_radius=10)
-        DISPLAYSURF.blit(box_surf, (box_rect.x, box_rect.y))
+        surface.blit(box_surf, (box_rect.x, box_rect.y))
 
-        tick += 1
-        if tick % 30 == 0:
-            cursor = not cursor
-
-        display_name = name + ("|" if cursor else "")
+        display_name = self.name_text + ("|" if self.cursor() else "")
         txt = glow_text(display_name, INPUT_FONT)
-        DISPLAYSURF.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, 330)))
+        surface.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, 330)))
 
         hint = glow_text("ENTER save • ESC cancel", SMALL_FONT, base_color=CYAN)
-        DISPLAYSURF.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, 420)))
+        surface.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, 420)))
 
-        pygame.display.update()
-        CLOCK.tick(FPS)
+class NoPlayersScene(MenuScene):
+    """Short notice, popped by itself after NOTICE_MS."""
+    name = "no players"
+    NOTICE_MS = 700
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                return
-            if event.type == KEYDOWN:
-                if event.key == K_RETURN and name.strip():
-                    db_manager.add_player(name.strip())
-                    return
-                elif event.key == K_BACKSPACE:
-                    name = name[:-1]
-                elif event.key == K_ESCAPE:
-                    return
-                else:
-                    if len(name) < 20 and event.unicode.isprintable():
-                        name += event.unicode
-
-def prompt_no_players():
-    timer = pygame.time.get_ticks() + 700
-    while pygame.time.get_ticks() < timer:
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
-        msg = glow_text("No players found. Use Player Manager to add.", MENU_FONT)
-        DISPLAYSURF.blit(msg, msg.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT//2)))
-        pygame.display.update()
-        CLOCK.tick(FPS)
+    def enter(self):
+        self.until = pygame.time.get_ticks() + self.NOTICE_MS
 
-# ---- Leaderboard ----
-def leaderboard_screen():
-    try:
-        players = db_manager.get_all_players()
-    except:
-        players = []
+    def update(self):
+        self.pacer.mark_active()   # keep ticking so the notice leaves on time
+        if pygame.time.get_ticks() >= self.until:
+            self.manager.pop(self)
 
-    players = sorted(
-        players,
-        key=lambda p: (p.get("mode1_high_score") or 0) + (p.get("mode2_high_score") or 0),
-        reverse=True
-    )
+    def draw_menu(self, surface):
+        msg = glow_text("No players found. Use Player Manager to add.", MENU_FONT)
+        surface.blit(msg, msg.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT//2)))
 
-    while True:
-        DISPLAYSURF.blit(SPACE_BG, (0,0))
+# ---- Leaderboard ----
+class LeaderboardScene(MenuScene):
+    name = "leaderboard"
+    start_y = 240; gap = 55
+
+    def enter(self):
+        try:
+            players = db_manager.get_all_players()
+        except:
+            players = []
+
+        self.players = sorted(
+            players,
+            key=lambda p: (p.get("mode1_high_score") or 0) + (p.get("mode2_high_score") or 0),
+            reverse=True
+        )
+
+    def handle_event(self, event):
+        if event.type == KEYDOWN and event.key == K_ESCAPE:
+            self.manager.pop(self)
+
+    def draw_menu(self, surface):
         title = glow_text("Leaderboard", TITLE_FONT)
-        DISPLAYSURF.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
+        surface.blit(title, title.get_rect(center=(WINDOWWIDTH//2, 120)))
 
-        if not players:
+        if not self.players:
             txt = glow_text("No players yet.", MENU_FONT)
-            DISPLAYSURF.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, 400)))
+            surface.blit(txt, txt.get_rect(center=(WINDOWWIDTH//2, 400)))
         else:
-            start_y = 240; gap = 55
-            for i,p in enumerate(players[:10]):
+            for i,p in enumerate(self.players[:10]):
                 name = p.get("name", "Unknown")
                 m1 = p.get("mode1_high_score") or 0
                 m2 = p.get("mode2_high_score") or 0
                 line = f"{i+1}. {name} — M1: {m1}   M2: {m2}"
                 surf = glow_text(line, MENU_FONT)
-                DISPLAYSURF.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, start_y + i*gap)))
+                surface.blit(surf, surf.get_rect(center=(WINDOWWIDTH//2, self.start_y + i*self.gap)))
 
         hint = glow_text("ESC to return", SMALL_FONT, base_color=CYAN)
-        DISPLAYSURF.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 80)))
-
-        pygame.display.update()
-        CLOCK.tick(FPS)
-
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                return
-            if event.type == KEYDOWN and event.key == K_ESCAPE:
-                return
+        surface.blit(hint, hint.get_rect(center=(WINDOWWIDTH//2, WINDOWHEIGHT - 80)))
 
 # ---- Startup ----
 if __name__ == "__main__":
+    SCENES.push(MainMenuScene())     # starts preloading the modes' assets
     _play_quick_loading_animation(700)
 
     try:
@@ -473,4 +586,5 @@ if __name__ == "__main__":
     except Exception as e:
         print("Dataset init failed:", e)
 
-    main_menu()
+    SCENES.run()
+    score_writer.shutdown(); pygame.quit()
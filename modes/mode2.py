@@ -6,24 +6,26 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 import random, time, pygame, copy
 from pygame.locals import *
-from systems import db_manager
+from systems import db_manager, score_writer
+from systems.dictionary import get_dictionary, ROOT, NO_NODE
+from systems import board_solver, text_cache, hud
+from systems.dirty_rects import DirtyRegions
+from systems.layers import StaticLayer
+from systems import profiler, assets
+from systems.timeline import Timeline
+from systems.scenes import Scene, SceneManager
 from systems.audio import speak_word
 
-# ---------------- PATH FIX FOR PYINSTALLER ----------------
-def resource_path(relative_path):
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return relative_path
-
-
 # ---------------- CONSTANTS ----------------
 FPS = 30
+CAPTION = "SpelloVerse — Mode 2 "
 WINDOWWIDTH, WINDOWHEIGHT = 900, 820
 BOARDWIDTH, BOARDHEIGHT = 8, 8
 TILE_SIZE = 64
 MARGIN_X = int((WINDOWWIDTH - TILE_SIZE * BOARDWIDTH) / 2)
 MARGIN_Y = 60
 XMARGIN, YMARGIN = MARGIN_X, MARGIN_Y
+BOARD_GEOMETRY = (BOARDWIDTH, BOARDHEIGHT, TILE_SIZE, XMARGIN, YMARGIN)
 
 # Colors
 DARK_BLUE = (12, 24, 60)
@@ -32,6 +34,17 @@ WHITE = (255, 255, 255)
 HUD_BG = (35, 35, 55, 180)
 GLOW_COLOR = LIGHT_BLUE
 INVALID_COLOR = (220, 60, 60)
+WORD_COLOR = (120, 255, 170)
+DEAD_END_COLOR = (255, 140, 90)
+
+# live drag feedback states
+PATH_PREFIX, PATH_WORD, PATH_DEAD, PATH_UNKNOWN = "prefix", "word", "dead", "unknown"
+PATH_COLORS = {
+    PATH_PREFIX: GLOW_COLOR,
+    PATH_WORD: WORD_COLOR,
+    PATH_DEAD: DEAD_END_COLOR,
+    PATH_UNKNOWN: GLOW_COLOR,
+}
 
 GLOW_RADIUS = 6
 MIN_WORD_LEN = 3
@@ -41,37 +54,72 @@ SPACE_BG = None
 PLAYER_ICON = None
 BACK_ICON = None
 BADSWAP_SOUND = None
+DICTIONARY = None
+STATIC_LAYER = None
 
 
 # ---------------- UTIL ----------------
 def _get_word_entry(word_upper):
+    # pure in-memory lookup; SQLite only if the dictionary failed to load
+    if DICTIONARY is not None:
+        return DICTIONARY.lookup(word_upper)
     try:
-        conn = db_manager.get_connection()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM words WHERE word = ?", (word_upper,))
-        row = cur.fetchone()
-        conn.close()
-        return dict(row) if row else None
+        return db_manager.get_word_entry(word_upper)
     except Exception:
         return None
 
+def _extend_prefix(node, letter):
+    """One O(1) trie step for the tile just added to the drag path."""
+    if DICTIONARY is None:
+        return None
+    return DICTIONARY.step(node, letter) if letter else NO_NODE
+
+def _path_state(node, length):
+    if DICTIONARY is None:
+        return PATH_UNKNOWN
+    if node == NO_NODE:
+        return PATH_DEAD
+    if length >= MIN_WORD_LEN and DICTIONARY.is_word(node):
+        return PATH_WORD
+    return PATH_PREFIX
+
+def _save_score(player_name, score, final=False):
+    """Queue the score (write-behind); final=True writes it before returning."""
+    if not player_name:
+        return
+    try:
+        score_writer.submit_score(player_name, score, mode="mode2")
+        if final:
+            score_writer.flush_scores()
+    except Exception:
+        pass
+
 def _random_letter():
     return chr(random.randint(65, 90))
 
 
 # ---------------- BOARD ----------------
 def make_letter_board():
+    if DICTIONARY is not None and len(DICTIONARY):
+        # reroll until the solver finds enough playable words
+        return board_solver.make_playable_board(BOARDWIDTH, BOARDHEIGHT, _random_letter, DICTIONARY)
     return [[_random_letter() for _ in range(BOARDHEIGHT)] for _ in range(BOARDWIDTH)]
 
 def pull_down_letters(board):
+    fresh = []
     for x in range(BOARDWIDTH):
         col = [board[x][y] for y in range(BOARDHEIGHT) if board[x][y] is not None]
         newcol = [None]*(BOARDHEIGHT - len(col)) + col
         for y in range(BOARDHEIGHT):
             if newcol[y] is None:
                 newcol[y] = _random_letter()
+                fresh.append((x, y))
         board[x] = newcol
 
+    # keep the board playable; only the newly dropped tiles get rerolled
+    if DICTIONARY is not None and len(DICTIONARY):
+        board_solver.ensure_playable(board, fresh, _random_letter, DICTIONARY)
+
 def remove_positions(board, positions):
     for (x,y) in positions:
         if 0 <= x < BOARDWIDTH and 0 <= y < BOARDHEIGHT:
@@ -89,199 +137,295 @@ def center_of_tile(x, y):
 
 # ---------------- MODE 2 MAIN ----------------
 def main(player_name=None):
-    global SPACE_BG, PLAYER_ICON, BACK_ICON, BADSWAP_SOUND
-    global FPSCLOCK, DISPLAYSURF, BASICFONT
-
-    pygame.init()
-    FPSCLOCK = pygame.time.Clock()
-    DISPLAYSURF = pygame.display.set_mode((WINDOWWIDTH, WINDOWHEIGHT))
-    pygame.display.set_caption("SpelloVerse — Mode 2 ")
-    BASICFONT = pygame.font.Font('freesansbold.ttf', 20)
-
-    # Background
-    try:
-        SPACE_BG = pygame.image.load(resource_path("assets/bg/space.png"))
-        SPACE_BG = pygame.transform.scale(SPACE_BG, (WINDOWWIDTH, WINDOWHEIGHT))
-    except:
-        SPACE_BG = pygame.Surface((WINDOWWIDTH, WINDOWHEIGHT))
-        SPACE_BG.fill((6,8,18))
-
-    # Player icon
-    try:
-        PLAYER_ICON = pygame.image.load(resource_path("assets/images/player.png"))
-        PLAYER_ICON = pygame.transform.smoothscale(PLAYER_ICON, (32,32))
-    except:
-        PLAYER_ICON = pygame.Surface((32,32))
-        PLAYER_ICON.fill((200,200,200))
+    """Play Mode 2 on its own (the game itself pushes Mode2Scene from the menu)."""
+    SceneManager((WINDOWWIDTH, WINDOWHEIGHT), CAPTION).run(Mode2Scene(player_name))
 
-    # Back icon
-    try:
-        BACK_ICON = pygame.image.load(resource_path("assets/images/back.png"))
-        BACK_ICON = pygame.transform.smoothscale(BACK_ICON, (36,36))
-    except:
-        BACK_ICON = pygame.Surface((36,36))
-        BACK_ICON.fill((200,120,120))
 
-    # Bad swap sound
-    try:
-        BADSWAP_SOUND = pygame.mixer.Sound(resource_path("assets/sounds/badswap.wav"))
-    except:
-        BADSWAP_SOUND = None
-
-    board = make_letter_board()
-    score = 0
-    last_word = ""
-    last_meaning = None
+def setup(display=None):
+    """Display, images, sound and dictionary (also used by the benchmarks)."""
+    global SPACE_BG, PLAYER_ICON, BACK_ICON, BADSWAP_SOUND, DICTIONARY, STATIC_LAYER
+    global DISPLAYSURF, BASICFONT
 
-    run_game_loop(player_name, board, score, last_word, last_meaning)
+    if display is None:
+        pygame.init()
+        display = pygame.display.set_mode((WINDOWWIDTH, WINDOWHEIGHT))
+    DISPLAYSURF = display
+    BASICFONT = text_cache.get_font(20)
 
+    loaded = load_assets()
+    SPACE_BG, PLAYER_ICON, BACK_ICON = loaded["bg"], loaded["player"], loaded["back"]
+    BADSWAP_SOUND = loaded["bad swap"]
 
+    # background + empty tiles, baked once in display format and kept across launches
+    if STATIC_LAYER is None:
+        STATIC_LAYER = StaticLayer(SPACE_BG, _draw_tiles)
 
-# ---------------- GAME LOOP ----------------
-def run_game_loop(player_name, board, score, last_word, last_meaning):
-    dragging = False
-    path = []
-    path_set = set()
+    # Word dictionary (trie, cached on disk after the first build)
+    try:
+        DICTIONARY = get_dictionary()
+    except Exception as e:
+        print("Dictionary load failed, falling back to SQLite:", e)
+        DICTIONARY = None
+
+
+def load_assets():
+    """Mode 2 images and sound from the shared asset cache (safe to call off the main thread)."""
+    return {
+        "bg": assets.image("assets/bg/space.png", (WINDOWWIDTH, WINDOWHEIGHT), smooth=False,
+                           fallback=(6, 8, 18)),
+        "player": assets.image("assets/images/player.png", (32, 32), fallback=(200, 200, 200)),
+        "back": assets.image("assets/images/back.png", (36, 36), fallback=(200, 120, 120)),
+        "bad swap": assets.sound("assets/sounds/badswap.wav"),
+    }
+
+
+
+# ---------------- SCENE ----------------
+class Mode2Scene(Scene):
+    """Trail Spell: drag across adjacent letters to spell words."""
+    name = "mode2"
+    fps = FPS
+    caption = CAPTION
+    catch_errors = True     # a crashing game drops back to the menu
+
+    def __init__(self, player_name=None):
+        super().__init__()
+        self.player_name = player_name
+
+    def enter(self):
+        global BACK_BUTTON_RECT_GLOBAL
+        setup(self.manager.display)
+        self.board = make_letter_board()
+        self.score = 0
+        self.last_word = ""
+        self.last_meaning = None
+        self.dragging = False
+        self._reset_path()
+
+        BACK_BUTTON_RECT_GLOBAL = pygame.Rect(0,0,0,0)
+        self.regions = DirtyRegions((WINDOWWIDTH, WINDOWHEIGHT))
+        self.timeline = Timeline()     # invalid-word flashes, advanced once per frame
+
+    def exit(self):
+        # window closed, ESC or back button: save the high score
+        self.timeline.cancel()
+        _save_score(self.player_name, self.score, final=True)
+
+    def resume(self):
+        super().resume()
+        self.regions.mark_all()
+
+    def _reset_path(self):
+        self.path = []
+        self.path_set = set()
+        self.path_nodes = []          # trie node after each tile of path (live prefix state)
+        self.path_state = PATH_UNKNOWN
+
+    def handle_event(self, event):
+        board = self.board
+        if event.type == KEYUP and event.key == K_ESCAPE:
+            self.manager.pop(self)
+
+        elif event.type == MOUSEBUTTONDOWN:
+            if _back_button_collide(event.pos):
+                self.manager.pop(self)
+                return
 
-    global BACK_BUTTON_RECT_GLOBAL
-    BACK_BUTTON_RECT_GLOBAL = pygame.Rect(0,0,0,0)
+            if self.timeline.busy:
+                # a new drag cuts the flash short
+                self.timeline.cancel()
+                self.regions.mark_all()
+
+            pos = _tile_at_pixel(event.pos)
+            if pos:
+                self.dragging = True
+                self.path = [pos]
+                self.path_set = {pos}
+                self.path_nodes = [_extend_prefix(ROOT, board[pos[0]][pos[1]])]
+                self.path_state = _path_state(self.path_nodes[-1], 1)
+
+        elif event.type == MOUSEMOTION and self.dragging:
+            pos = _tile_at_pixel(event.pos)
+            if pos and pos not in self.path_set:
+                lx,ly = self.path[-1]
+                x,y = pos
+                if max(abs(lx-x), abs(ly-y)) <= 1:  # adjacent
+                    self.path.append(pos); self.path_set.add(pos)
+                    self.path_nodes.append(_extend_prefix(self.path_nodes[-1], board[x][y]))
+                    self.path_state = _path_state(self.path_nodes[-1], len(self.path))
+
+        elif event.type == MOUSEBUTTONUP and self.dragging:
+            self._submit_path()
+            self.dragging = False
+            self._reset_path()
+
+    def _submit_path(self):
+        board, path, path_state = self.board, self.path, self.path_state
+        word = "".join(board[x][y] for (x,y) in path if board[x][y])
+        if len(word) >= MIN_WORD_LEN:
+            if path_state == PATH_WORD:
+                entry = DICTIONARY.entry(DICTIONARY.entry_index(self.path_nodes[-1]))
+            elif path_state == PATH_DEAD:
+                entry = None
+            else:
+                with profiler.scope("db"):
+                    entry = _get_word_entry(word.upper())
+            if entry:
+                self.score += SCORE_PER_LETTER * len(word)
+                try: speak_word(word, entry.get("audio_path"))
+                except: pass
 
-    while True:
+                remove_positions(board, path)
+                pull_down_letters(board)
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                if player_name:
-                    try:
-                        db_manager.update_high_score(player_name, score, mode="mode2")
-                    except: pass
-                pygame.quit(); sys.exit()
+                self.last_word = word.upper()
+                self.last_meaning = entry.get("meaning")
 
-            elif event.type == KEYUP and event.key == K_ESCAPE:
-                if player_name:
-                    try:
-                        db_manager.update_high_score(player_name, score, mode="mode2")
-                    except: pass
+                _save_score(self.player_name, self.score)
                 return
 
-            elif event.type == MOUSEBUTTONDOWN:
-                if _back_button_collide(event.pos):
-                    if player_name:
-                        try:
-                            db_manager.update_high_score(player_name, score, mode="mode2")
-                        except: pass
-                    return
-
-                pos = _tile_at_pixel(event.pos)
-                if pos:
-                    dragging = True
-                    path = [pos]
-                    path_set = {pos}
-
-            elif event.type == MOUSEMOTION and dragging:
-                pos = _tile_at_pixel(event.pos)
-                if pos and pos not in path_set:
-                    lx,ly = path[-1]
-                    x,y = pos
-                    if max(abs(lx-x), abs(ly-y)) <= 1:  # adjacent
-                        path.append(pos); path_set.add(pos)
-
-            elif event.type == MOUSEBUTTONUP and dragging:
-                # Submit word
-                word = "".join(board[x][y] for (x,y) in path if board[x][y])
-                if len(word) >= 3:
-                    entry = _get_word_entry(word.upper())
-                    if entry:
-                        score += SCORE_PER_LETTER * len(word)
-                        try: speak_word(word, entry.get("audio_path"))
-                        except: pass
-
-                        remove_positions(board, path)
-                        pull_down_letters(board)
-
-                        last_word = word.upper()
-                        last_meaning = entry.get("meaning")
-
-                        if player_name:
-                            try:
-                                db_manager.update_high_score(player_name, score, mode="mode2")
-                            except: pass
-                    else:
-                        if BADSWAP_SOUND:
-                            try: BADSWAP_SOUND.play()
-                            except: pass
-                        _flash_invalid(path)
-                else:
-                    if BADSWAP_SOUND:
-                        try: BADSWAP_SOUND.play()
-                        except: pass
-                    _flash_invalid(path)
-
-                dragging = False
-                path = []
-                path_set = set()
-
-        # DRAW
-        _draw_frame(board, score, player_name, last_word, last_meaning)
-        if path:
-            _draw_path(path)
-
-        pygame.display.update()
-        FPSCLOCK.tick(FPS)
+        if BADSWAP_SOUND:
+            try: BADSWAP_SOUND.play()
+            except: pass
+        self.timeline.add(_flash_invalid(path, path_state, board, self.score, self.player_name,
+                                         self.last_word, self.last_meaning))
+
+    def update(self):
+        if self.timeline.busy:
+            # flash frames are drawn whole by the timeline step
+            with profiler.scope("animate"):
+                if self.timeline.update():
+                    self.regions.mark_all()
+            if not self.timeline.busy:
+                self.regions.mark_all()
+
+    def draw(self, surface):
+        regions = self.regions
+        if not self.timeline.busy:
+            with profiler.scope("draw"):
+                # DRAW — only the regions whose content changed since last frame
+                _track_frame(regions, self.board, self.score, self.player_name, self.last_word,
+                             self.last_meaning, self.path, self.path_state)
+                regions.track("profiler", *profiler.overlay_state())
+                area = regions.area()
+                if area:
+                    surface.set_clip(area)
+                    _draw_frame(self.board, self.score, self.player_name, self.last_word,
+                                self.last_meaning, area)
+                    if self.path:
+                        _draw_path(self.path, self.path_state)
+                    profiler.draw_overlay(surface)
+                    surface.set_clip(None)
+
+        with profiler.scope("flip"):
+            presented = regions.present()
+        if presented or self.timeline.busy:
+            self.pacer.mark_active()
 
 
 # ---------------- DRAWING ----------------
 def _tile_at_pixel(pos):
+    # tiles are a regular grid, so this is arithmetic rather than 64 rect tests
     mx,my = pos
+    if mx < XMARGIN or my < YMARGIN:
+        return None
+    x = (mx - XMARGIN) // TILE_SIZE
+    y = (my - YMARGIN) // TILE_SIZE
+    if x < BOARDWIDTH and y < BOARDHEIGHT:
+        return (x,y)
+    return None
+
+def _track_frame(regions, board, score, player_name, last_word, last_meaning, path, path_state):
+    """Tell the dirty-region tracker what every screen element shows this frame."""
     for x in range(BOARDWIDTH):
         for y in range(BOARDHEIGHT):
-            if tile_rect(x,y).collidepoint(mx,my):
-                return (x,y)
-    return None
+            regions.track((x, y), board[x][y], tile_rect(x, y))
+    if HUD_PANEL is not None:
+        regions.track("hud", (player_name, score, last_word, last_meaning), HUD_PANEL.rect)
+    else:
+        regions.mark_all()
+    regions.track("path", (tuple(path), path_state), _path_bounds(path))
+
+def _draw_tiles(surface):
+    """Empty rounded tiles for the static layer."""
+    for x in range(BOARDWIDTH):
+        for y in range(BOARDHEIGHT):
+            r = tile_rect(x,y)
+            pygame.draw.rect(surface, DARK_BLUE, r, border_radius=8)
+            pygame.draw.rect(surface, LIGHT_BLUE, r, 2, border_radius=8)
 
-def _draw_frame(board, score, player_name, last_word, last_meaning):
-    DISPLAYSURF.blit(SPACE_BG, (0,0))
+def _draw_frame(board, score, player_name, last_word, last_meaning, area=None):
+    """Background, tiles and HUD; with `area`, only what intersects it."""
+    STATIC_LAYER.draw(DISPLAYSURF, area, BOARD_GEOMETRY)
 
+    # tiles come from the static layer; only the letters are dynamic
     for x in range(BOARDWIDTH):
         for y in range(BOARDHEIGHT):
             r = tile_rect(x,y)
-            pygame.draw.rect(DISPLAYSURF, DARK_BLUE, r, border_radius=8)
-            pygame.draw.rect(DISPLAYSURF, LIGHT_BLUE, r, 2, border_radius=8)
-
+            if area is not None and not r.colliderect(area):
+                continue
             letter = board[x][y]
             if letter:
-                font = pygame.font.Font('freesansbold.ttf', 28)
-                surf = font.render(letter, True, WHITE)
+                surf = text_cache.render(letter, 28, WHITE)
                 DISPLAYSURF.blit(surf, surf.get_rect(center=r.center))
 
     drawHUD_local(player_name, score, last_word, last_meaning)
 
 
 # ---------------- PATH GLOW ----------------
-def _draw_path(path):
+_GLOW_SURFACES = {}
+
+def _glow_surface(color):
+    """Tile glow, built once per color so long paths cost one blit per tile."""
+    glow = _GLOW_SURFACES.get(color)
+    if glow is None:
+        glow = pygame.Surface((TILE_SIZE+12, TILE_SIZE+12), pygame.SRCALPHA)
+        pygame.draw.ellipse(glow, (*color, 70), (0,0,glow.get_width(),glow.get_height()))
+        _GLOW_SURFACES[color] = glow
+    return glow
+
+def _path_bounds(path):
+    """Screen area covered by the trail + glow of `path` (empty rect if no path)."""
+    if not path:
+        return pygame.Rect(0, 0, 0, 0)
+    rects = [tile_rect(x,y).inflate(12, 12) for (x,y) in path]
+    return rects[0].unionall(rects[1:])
+
+def _draw_path(path, state=PATH_UNKNOWN):
+    """Trail + tile glow; color shows valid prefix / complete word / dead end."""
+    color = PATH_COLORS.get(state, GLOW_COLOR)
     if len(path) >= 2:
         pts = [center_of_tile(x,y) for (x,y) in path]
-        pygame.draw.lines(DISPLAYSURF, GLOW_COLOR, False, pts, 6)
+        pygame.draw.lines(DISPLAYSURF, color, False, pts, 6)
 
+    glow = _glow_surface(color)
     for (x,y) in path:
         r = tile_rect(x,y)
-        glow = pygame.Surface((TILE_SIZE+12, TILE_SIZE+12), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow, (*GLOW_COLOR, 70), (0,0,glow.get_width(),glow.get_height()))
         DISPLAYSURF.blit(glow, (r.x-6, r.y-6))
 
 
 # ---------------- INVALID FLASH ----------------
-def _flash_invalid(path):
+def _flash_invalid(path, path_state, board, score, player_name, last_word, last_meaning):
+    """Timeline step: blink the tiles of a rejected path red three times."""
     overlay = pygame.Surface((TILE_SIZE, TILE_SIZE))
     overlay.set_alpha(160)
     overlay.fill(INVALID_COLOR)
+    path = list(path)
 
-    for _ in range(3):
+    def flash_off():
+        _draw_frame(board, score, player_name, last_word, last_meaning)
+        _draw_path(path, path_state)
+
+    def flash_on():
+        flash_off()
         for (x,y) in path:
             DISPLAYSURF.blit(overlay, tile_rect(x,y))
-        pygame.display.update()
-        pygame.time.delay(80)
-        pygame.display.update()
-        pygame.time.delay(60)
+
+    for _ in range(3):
+        yield flash_on
+        yield 80
+        yield flash_off
+        yield 60
 
 
 # ---------------- HUD ----------------
@@ -301,45 +445,24 @@ def wrap_text(text, font, maxw):
         lines.append(cur)
     return lines
 
-def drawHUD_local(player_name, score, last_word, last_meaning):
+HUD_PANEL = None
+
+def _make_hud_panel():
     hud_h = 150
     hud_y = WINDOWHEIGHT - hud_h - 30
-    px = 30; py = 22
     width = WINDOWWIDTH - 40
+    return hud.HudPanel(width, hud_h, (20, hud_y), PLAYER_ICON, BACK_ICON,
+                        width - 60, wrap_text,
+                        bg_color=HUD_BG, border_color=(255,255,255,40),
+                        score_label_color=WHITE, score_value_x=30+330)
 
-    surf = pygame.Surface((width, hud_h), pygame.SRCALPHA)
-    pygame.draw.rect(surf, HUD_BG, (0,0,width,hud_h), border_radius=24)
-    pygame.draw.rect(surf, (255,255,255,40), (4,4,width-8,hud_h-8), border_radius=22, width=2)
-
-    fb = pygame.font.Font("freesansbold.ttf", 24)
-    fs = pygame.font.Font("freesansbold.ttf", 18)
-
-    # Word + meaning
-    surf.blit(fs.render("Word:", True, (240,240,250)), (px, py+2))
-    surf.blit(fb.render(last_word or "-", True, (255,215,80)), (px+70, py))
-
-    meaning = last_meaning or "Meaning not available."
-    mx = px + 260
-    lines = wrap_text(meaning, fs, width - mx - px)
-    for i, line in enumerate(lines[:2]):
-        surf.blit(fs.render(line, True, (200,200,200)), (mx, py + i*22))
-
-    # Player + score + back
-    by = py + 70
-    surf.blit(PLAYER_ICON, (px, by-5))
-    surf.blit(fb.render(player_name or "-", True, WHITE), (px+70, by))
-
-    surf.blit(fs.render("Score:", True, WHITE), (px+260, by+2))
-    surf.blit(fb.render(str(score), True, WHITE), (px+330, by))
-
-    # back icon
-    back_x = width - 60
-    surf.blit(BACK_ICON, (back_x, by-6))
-
-    DISPLAYSURF.blit(surf, (20, hud_y))
-
-    global BACK_BUTTON_RECT_GLOBAL
-    BACK_BUTTON_RECT_GLOBAL = pygame.Rect(20+back_x, hud_y+by-6, BACK_ICON.get_width(), BACK_ICON.get_height())
+def drawHUD_local(player_name, score, last_word, last_meaning):
+    # retained HUD: a single blit unless a value changed
+    global HUD_PANEL, BACK_BUTTON_RECT_GLOBAL
+    if HUD_PANEL is None:
+        HUD_PANEL = _make_hud_panel()
+    HUD_PANEL.draw(DISPLAYSURF, player_name, score, last_word, last_meaning)
+    BACK_BUTTON_RECT_GLOBAL = HUD_PANEL.back_rect
 
 
 def _back_button_collide(pos):
@@ -0,0 +1,219 @@
+# systems/assets.py
+# Process-wide asset manager: images, atlases and sounds are loaded once
+# per key and shared by every screen and every mode launch.
+#
+# Images are stored in the display's pixel format (converted lazily if they
+# were loaded before a display existed), tile sets like the gems are packed
+# into one atlas surface, and sounds are decoded once into pygame.mixer.Sound.
+# Everything goes through one lock, so preload_async() can warm the cache
+# from a background thread while the loading screen runs; a caller that
+# needs an asset the preloader is busy with simply waits for it.
+#
+# Returned surfaces and sounds are shared — blit / play them, never draw on
+# them.
+import os, sys, threading, time
+import pygame
+from systems.layers import display_format
+
+_lock = threading.RLock()
+_assets = {}              # key -> [asset, converted, kind, bytes]
+_stats = {"hits": 0, "misses": 0, "load_ms": 0.0, "failures": 0}
+
+
+def resource_path(relative_path):
+    """Absolute path for PyInstaller or normal environment."""
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return relative_path
+
+
+# ---------- images ----------
+def image(path, size=None, smooth=True, fallback=None):
+    """
+    Image at `path`, scaled to `size` when given. If loading fails, a plain
+    surface of `size` filled with `fallback` is returned instead (or the
+    error is raised when there is no fallback).
+    """
+    key = ("image", path, tuple(size) if size else None, smooth)
+    return _get(key, lambda: _load_image(path, size, smooth, fallback))
+
+
+def _load_image(path, size, smooth, fallback):
+    try:
+        surf = pygame.image.load(resource_path(path))
+    except Exception as e:
+        if fallback is None or size is None:
+            raise
+        print("Image load failed, using fallback:", path, e)
+        _stats["failures"] += 1
+        surf = pygame.Surface(size)
+        surf.fill(fallback)
+        return surf
+    if size and surf.get_size() != tuple(size):
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        try:
+            surf = scale(surf, size)
+        except Exception:
+            surf = pygame.transform.scale(surf, size)
+    return surf
+
+
+# ---------- atlas ----------
+def atlas(paths, tile_size, fit=1.0, fallback=(150, 150, 150)):
+    """
+    Tiles for `paths`, packed side by side into one atlas surface. Each
+    image is shrunk to fit `fit` x tile_size (never enlarged) and centred
+    in its tile; a missing image becomes a `fallback`-filled tile.
+    Returns a list of subsurfaces of the atlas, one per path.
+    """
+    key = ("atlas", tuple(paths), tile_size, fit)
+    return list(_get(key, lambda: _build_atlas(paths, tile_size, fit, fallback)).tiles)
+
+
+class Atlas:
+    """One sheet surface plus the tile subsurfaces cut from it."""
+
+    def __init__(self, sheet, tile_size, count):
+        self.sheet = sheet
+        self.tiles = [sheet.subsurface((i * tile_size, 0, tile_size, tile_size)) for i in range(count)]
+
+
+def _build_atlas(paths, tile_size, fit, fallback):
+    sheet = pygame.Surface((tile_size * len(paths), tile_size), pygame.SRCALPHA)
+    inner_max = int(tile_size * fit)
+    for i, path in enumerate(paths):
+        x = i * tile_size
+        try:
+            raw = pygame.image.load(resource_path(path))
+        except Exception as e:
+            print("Atlas image load failed:", path, e)
+            _stats["failures"] += 1
+            sheet.fill(fallback, (x, 0, tile_size, tile_size))
+            continue
+        rw, rh = raw.get_size()
+        factor = min(1.0, inner_max / max(rw, rh))
+        w, h = max(1, int(rw * factor)), max(1, int(rh * factor))
+        if w > tile_size or h > tile_size:
+            factor = min(tile_size / rw, tile_size / rh)
+            w, h = int(rw * factor), int(rh * factor)
+        try:
+            inner = pygame.transform.smoothscale(raw, (w, h))
+        except Exception:
+            inner = pygame.transform.scale(raw, (w, h))
+        sheet.blit(inner, (x + (tile_size - w) // 2, (tile_size - h) // 2))
+    return Atlas(display_format(sheet), tile_size, len(paths))
+
+
+# ---------- sounds ----------
+def sound(path):
+    """Decoded Sound for `path`, or None when the file or the mixer is unavailable."""
+    key = ("sound", path)
+    return _get(key, lambda: _load_sound(path))
+
+
+def _load_sound(path):
+    try:
+        return pygame.mixer.Sound(resource_path(path))
+    except Exception as e:
+        print("Sound load failed:", path, e)
+        _stats["failures"] += 1
+        return None
+
+
+# ---------- cache ----------
+def _has_display():
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+
+def _get(key, load):
+    with _lock:
+        entry = _assets.get(key)
+        if entry is None:
+            _stats["misses"] += 1
+            start = time.perf_counter()
+            asset = load()
+            converted = False
+            if isinstance(asset, pygame.Surface) and _has_display():
+                asset, converted = display_format(asset), True
+            entry = _assets[key] = [asset, converted, key[0], _size_of(asset)]
+            _stats["load_ms"] += (time.perf_counter() - start) * 1000
+            return asset
+        _stats["hits"] += 1
+        if not entry[1] and isinstance(entry[0], pygame.Surface) and _has_display():
+            # loaded before the display existed: convert once it does
+            entry[0], entry[1] = display_format(entry[0]), True
+            entry[3] = _size_of(entry[0])
+        return entry[0]
+
+
+def _size_of(asset):
+    if isinstance(asset, Atlas):
+        asset = asset.sheet
+    if isinstance(asset, pygame.Surface):
+        return asset.get_width() * asset.get_height() * asset.get_bytesize()
+    if isinstance(asset, pygame.mixer.Sound):
+        init = pygame.mixer.get_init()
+        if init:
+            freq, fmt, channels = init
+            return int(asset.get_length() * freq * channels * abs(fmt) // 8)
+    return 0
+
+
+# ---------- preloading ----------
+def preload_async(*loaders):
+    """
+    Run each loader (a callable that requests assets from this module) in
+    one background thread. Returns the thread; join() it to wait.
+    """
+    def run():
+        for load in loaders:
+            try:
+                load()
+            except Exception as e:
+                print("Asset preload failed:", e)
+
+    thread = threading.Thread(target=run, name="asset-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+# ---------- reporting ----------
+def memory_report():
+    """Bytes held per kind and per asset, largest first."""
+    with _lock:
+        entries = sorted(((k, e[2], e[3]) for k, e in _assets.items()), key=lambda t: -t[2])
+    kinds = {}
+    for _, kind, size in entries:
+        count, total = kinds.get(kind, (0, 0))
+        kinds[kind] = (count + 1, total + size)
+    return {
+        "total_bytes": sum(size for _, _, size in entries),
+        "kinds": {kind: {"count": c, "bytes": b} for kind, (c, b) in kinds.items()},
+        "assets": [{"key": _label(k), "kind": kind, "bytes": size} for k, kind, size in entries],
+    }
+
+
+def _label(key):
+    kind, path = key[0], key[1]
+    if kind == "atlas":
+        return f"atlas of {len(path)} ({key[2]}px tiles)"
+    if kind == "image" and key[2]:
+        return f"{path} @ {key[2][0]}x{key[2][1]}"
+    return path
+
+
+def stats():
+    """Counters since the last reset_stats(), plus the number of cached assets."""
+    with _lock:
+        return dict(_stats, assets=len(_assets))
+
+
+def reset_stats():
+    for k in _stats:
+        _stats[k] = 0
+
+
+def clear():
+    """Drop every cached asset (e.g. after pygame.quit())."""
+    with _lock:
+        _assets.clear()
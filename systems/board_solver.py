@@ -0,0 +1,138 @@
+# systems/board_solver.py
+# Boggle-style solver for mode2 letter boards: lists every dictionary word
+# reachable by chaining 8-neighbour tiles (each tile used once per word),
+# pruning any path whose letters are not a prefix in the trie.
+import random
+from systems.dictionary import ROOT, NO_NODE
+
+MIN_WORD_LEN = 3
+MIN_PLAYABLE_WORDS = 8     # boards with fewer findable words get rerolled
+REROLL_ATTEMPTS = 25
+
+_NEIGHBOURS = {}
+
+
+def _neighbours(width, height):
+    """Per-cell tuple of 8-neighbour cell indices (cell = x * height + y)."""
+    key = (width, height)
+    table = _NEIGHBOURS.get(key)
+    if table is None:
+        table = []
+        for x in range(width):
+            for y in range(height):
+                table.append(tuple(
+                    nx * height + ny
+                    for nx in (x-1, x, x+1) for ny in (y-1, y, y+1)
+                    if (nx, ny) != (x, y) and 0 <= nx < width and 0 <= ny < height))
+        table = tuple(table)
+        _NEIGHBOURS[key] = table
+    return table
+
+
+def solve(board, dictionary, min_len=MIN_WORD_LEN, limit=None):
+    """
+    Return {word: path} for words on `board` (board[x][y] = letter).
+    path is the list of (x, y) tiles of the first way found to spell it.
+    With `limit`, stop as soon as that many distinct words are found.
+    """
+    width, height = len(board), len(board[0])
+    letters = [board[x][y] for x in range(width) for y in range(height)]
+    neighbours = _neighbours(width, height)
+    step = dictionary.step
+    is_word = dictionary.is_word
+    found = {}
+    visited = [False] * len(letters)
+    path = []
+
+    class _Done(Exception):
+        pass
+
+    def dfs(cell, node):
+        visited[cell] = True
+        path.append(cell)
+        if len(path) >= min_len and is_word(node):
+            word = "".join(letters[c] for c in path)
+            if word not in found:
+                found[word] = [divmod(c, height) for c in path]
+                if limit is not None and len(found) >= limit:
+                    raise _Done
+        for n in neighbours[cell]:
+            if not visited[n] and letters[n]:
+                child = step(node, letters[n])
+                if child != NO_NODE:
+                    dfs(n, child)
+        path.pop()
+        visited[cell] = False
+
+    try:
+        for cell, ch in enumerate(letters):
+            if ch:
+                node = step(ROOT, ch)
+                if node != NO_NODE:
+                    dfs(cell, node)
+    except _Done:
+        pass
+    return found
+
+
+def count_words(board, dictionary, limit=None):
+    return len(solve(board, dictionary, limit=limit))
+
+
+def is_playable(board, dictionary, min_words=MIN_PLAYABLE_WORDS):
+    """True when at least `min_words` words can be found (stops early)."""
+    return count_words(board, dictionary, limit=min_words) >= min_words
+
+
+# ---------- guaranteed-playable generation ----------
+def make_playable_board(width, height, random_letter, dictionary,
+                        min_words=MIN_PLAYABLE_WORDS, attempts=REROLL_ATTEMPTS, rng=random):
+    """Random board with at least `min_words` findable words."""
+    board = [[random_letter() for _ in range(height)] for _ in range(width)]
+    for _ in range(attempts):
+        if is_playable(board, dictionary, min_words):
+            return board
+        board = [[random_letter() for _ in range(height)] for _ in range(width)]
+    _plant_words(board, dictionary, min_words, rng)
+    return board
+
+
+def ensure_playable(board, fresh_cells, random_letter, dictionary,
+                    min_words=MIN_PLAYABLE_WORDS, attempts=REROLL_ATTEMPTS, rng=random):
+    """
+    After a refill, reroll only the freshly dropped tiles until the board is
+    playable again; plant words as a last resort. Modifies board in place.
+    """
+    if is_playable(board, dictionary, min_words):
+        return board
+    for _ in range(attempts if fresh_cells else 0):
+        for (x, y) in fresh_cells:
+            board[x][y] = random_letter()
+        if is_playable(board, dictionary, min_words):
+            return board
+    _plant_words(board, dictionary, min_words, rng)
+    return board
+
+
+def _plant_words(board, dictionary, min_words, rng, max_len=5):
+    """Write random short dictionary words along random tile paths."""
+    if not len(dictionary):
+        return
+    width, height = len(board), len(board[0])
+    neighbours = _neighbours(width, height)
+    for _ in range(min_words * 20):
+        if is_playable(board, dictionary, min_words):
+            return
+        word = dictionary.word(rng.randrange(len(dictionary)))
+        if not MIN_WORD_LEN <= len(word) <= max_len:
+            continue
+        cells = [rng.randrange(width * height)]
+        while len(cells) < len(word):
+            options = [n for n in neighbours[cells[-1]] if n not in cells]
+            if not options:
+                break
+            cells.append(rng.choice(options))
+        if len(cells) == len(word):
+            for c, ch in zip(cells, word):
+                x, y = divmod(c, height)
+                board[x][y] = ch
@@ -0,0 +1,16 @@
+# systems/conftest.py
+# Fixtures shared by the systems/ tests.
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from systems import db_manager
+
+
+@pytest.fixture
+def fresh_db(tmp_path):
+    """Point db_manager at an empty temp database; restore the old path afterwards."""
+    old_path = db_manager.DB_PATH
+    db_manager.set_db_path(str(tmp_path / "test.sqlite3"))
+    yield
+    db_manager.set_db_path(old_path, init=False)
@@ -1,24 +1,143 @@
 # systems/db_manager.py
-import sqlite3, os, datetime
+import sqlite3, os, datetime, threading, atexit, time, itertools, json
+from contextlib import contextmanager
+from systems.word_sampler import WordSampler
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "db.sqlite3")
 
-# ---------- DB helpers ----------
-def get_connection():
-    conn = sqlite3.connect(DB_PATH)
+# Pragmas applied to every pooled connection. WAL lets the dataset builder
+# thread write while the UI thread keeps reading; NORMAL sync is safe in WAL.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",      # ~16 MB page cache
+    "PRAGMA mmap_size=67108864",     # 64 MB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+# ---------- Connection pool ----------
+_local = threading.local()
+_pool_lock = threading.Lock()
+_pool = []            # every live pooled connection, so they can be closed at exit
+_pool_generation = 0  # bumped when DB_PATH changes so stale thread connections are dropped
+_init_lock = threading.RLock()
+_initialized_path = None  # DB_PATH whose schema init_db() has brought up to date
+
+def _open_connection(path=None):
+    # check_same_thread=False only so close_connections() can close them
+    # from the main thread; each connection is still used by one thread.
+    conn = sqlite3.connect(path or DB_PATH, timeout=5.0, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.DatabaseError:
+            pass
     return conn
 
+def _thread_connection():
+    """Return this thread's pooled connection, opening it on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.generation == _pool_generation:
+        return conn
+    conn = _open_connection()
+    with _pool_lock:
+        _pool.append(conn)
+    _local.conn = conn
+    _local.generation = _pool_generation
+    _local.depth = 0
+    return conn
+
+def _ensure_schema():
+    """Run init_db() once per DB_PATH, on first use rather than at import."""
+    global _initialized_path
+    path = DB_PATH
+    if _initialized_path == path:
+        return
+    with _init_lock:
+        # init_db() itself borrows connections: skip the check while it runs
+        if _initialized_path == path or getattr(_local, "initializing", False):
+            return
+        _local.initializing = True
+        try:
+            init_db()
+            _initialized_path = path
+        finally:
+            _local.initializing = False
+
+@contextmanager
+def connection():
+    """Borrow the calling thread's pooled connection (no implicit commit)."""
+    _ensure_schema()
+    yield _thread_connection()
+
+@contextmanager
+def transaction():
+    """
+    Borrow the thread's connection inside a transaction.
+    Commits when the outermost block exits, rolls back on error.
+    """
+    _ensure_schema()
+    conn = _thread_connection()
+    _local.depth += 1
+    try:
+        yield conn
+    except Exception:
+        _local.depth -= 1
+        if _local.depth == 0:
+            conn.rollback()
+        raise
+    _local.depth -= 1
+    if _local.depth == 0:
+        conn.commit()
+
+def close_connections():
+    """Close every pooled connection (all threads). Safe to call more than once."""
+    global _pool_generation
+    with _pool_lock:
+        conns = list(_pool)
+        _pool.clear()
+        _pool_generation += 1
+    for conn in conns:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+atexit.register(close_connections)
+
+def set_db_path(path, init=True):
+    """
+    Point the manager at another database file (tools/benchmarks). Its
+    schema is brought up to date now, or with init=False on first use.
+    """
+    global DB_PATH
+    close_connections()
+    DB_PATH = path
+    _sampler.invalidate()
+    if init:
+        _ensure_schema()
+
+def get_connection():
+    """
+    Legacy helper: returns a new, unpooled connection the caller must close.
+    Prefer `with db_manager.connection() as conn:`.
+    """
+    _ensure_schema()
+    return _open_connection()
+
 def _col_exists(cur, table, col):
     cur.execute("PRAGMA table_info(%s)" % table)
     cols = [r["name"] for r in cur.fetchall()]
     return col in cols
 
 # ---------- Init & Migration ----------
-def init_db():
-    conn = get_connection()
-    cur = conn.cursor()
+# Schema changes are numbered migrations tracked in PRAGMA user_version.
+# Each one runs exactly once, in its own transaction; append new ones to
+# MIGRATIONS and never edit one that has shipped.
 
+def _migration_1_base_schema(cur):
     # base players table (legacy may have high_score only)
     cur.execute("""
         CREATE TABLE IF NOT EXISTS players (
@@ -40,62 +159,88 @@ def init_db():
         )
     """)
 
-    # Add mode-specific columns if missing
+    # Add mode-specific columns if missing (pre-versioning databases may have them)
     if not _col_exists(cur, "players", "mode1_high_score"):
-        try:
-            cur.execute("ALTER TABLE players ADD COLUMN mode1_high_score INTEGER DEFAULT NULL")
-            cur.execute("ALTER TABLE players ADD COLUMN mode1_score_time TEXT DEFAULT NULL")
-        except Exception:
-            pass
+        cur.execute("ALTER TABLE players ADD COLUMN mode1_high_score INTEGER DEFAULT NULL")
+        cur.execute("ALTER TABLE players ADD COLUMN mode1_score_time TEXT DEFAULT NULL")
 
     if not _col_exists(cur, "players", "mode2_high_score"):
-        try:
-            cur.execute("ALTER TABLE players ADD COLUMN mode2_high_score INTEGER DEFAULT NULL")
-            cur.execute("ALTER TABLE players ADD COLUMN mode2_score_time TEXT DEFAULT NULL")
-        except Exception:
-            pass
+        cur.execute("ALTER TABLE players ADD COLUMN mode2_high_score INTEGER DEFAULT NULL")
+        cur.execute("ALTER TABLE players ADD COLUMN mode2_score_time TEXT DEFAULT NULL")
 
-    # If legacy high_score exists, move it into mode1_high_score when mode1_high_score is null
-    try:
-        cur.execute("SELECT id, high_score, mode1_high_score FROM players")
-        rows = cur.fetchall()
-        for r in rows:
-            hs = r["high_score"] if r["high_score"] is not None else 0
-            if r["mode1_high_score"] is None:
-                cur.execute("UPDATE players SET mode1_high_score = ? WHERE id = ?", (hs, r["id"]))
-        conn.commit()
-    except Exception:
-        # ignore migration problems but keep DB usable
-        pass
+    # Move legacy high_score into mode1_high_score where mode1 has no score yet
+    cur.execute("""
+        UPDATE players SET mode1_high_score = COALESCE(high_score, 0)
+        WHERE mode1_high_score IS NULL
+    """)
 
-    conn.commit()
-    conn.close()
+def _migration_2_hot_query_indexes(cur):
+    # words(word) is already indexed by its UNIQUE constraint
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_words_length ON words(length)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_players_mode1_score ON players(mode1_high_score)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_players_mode2_score ON players(mode2_high_score)")
+
+def _migration_3_meta_table(cur):
+    # small key/value store (dataset build checkpoints, ...)
+    cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+MIGRATIONS = [
+    _migration_1_base_schema,
+    _migration_2_hot_query_indexes,
+    _migration_3_meta_table,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def schema_version():
+    with connection() as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def init_db():
+    """Bring the schema up to SCHEMA_VERSION. A no-op once it is current."""
+    version = schema_version()
+    for number, migrate in enumerate(MIGRATIONS[version:], start=version + 1):
+        with transaction() as conn:
+            _begin(conn)
+            migrate(conn.cursor())
+            conn.execute(f"PRAGMA user_version = {number}")
+    _restore_word_indexes()
 
-# initialize on import
-init_db()
+def _begin(conn):
+    """Open a transaction explicitly so DDL joins it (sqlite3 only auto-begins DML)."""
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+
+
+# ---------------- META API ----------------
+def get_meta(key, default=None):
+    with connection() as conn:
+        row = conn.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+    return row["value"] if row else default
+
+def set_meta(key, value):
+    """Store a value; joins the caller's transaction if one is open."""
+    with transaction() as conn:
+        if value is None:
+            conn.execute("DELETE FROM meta WHERE key=?", (key,))
+        else:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
 
 
 # ---------------- PLAYERS API ----------------
 def add_player(name):
-    conn = get_connection(); cur = conn.cursor()
     try:
-        cur.execute("INSERT INTO players (name) VALUES (?)", (name,))
-        conn.commit()
+        with transaction() as conn:
+            conn.execute("INSERT INTO players (name) VALUES (?)", (name,))
     except Exception:
         pass
-    conn.close()
 
 def delete_player(name):
-    conn = get_connection(); cur = conn.cursor()
-    cur.execute("DELETE FROM players WHERE name=?", (name,))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute("DELETE FROM players WHERE name=?", (name,))
 
 def get_all_players():
-    conn = get_connection(); cur = conn.cursor()
-    cur.execute("SELECT * FROM players ORDER BY name ASC")
-    rows = cur.fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute("SELECT * FROM players ORDER BY name ASC").fetchall()
     return [dict(r) for r in rows]
 
 def update_high_score(name, score, mode="mode1"):
@@ -109,71 +254,160 @@ def update_high_score(name, score, mode="mode1"):
     score_col = f"{mode}_high_score"
     time_col = f"{mode}_score_time"
 
-    conn = get_connection(); cur = conn.cursor()
-    cur.execute(f"SELECT {score_col} FROM players WHERE name=?", (name,))
-    row = cur.fetchone()
+    with transaction() as conn:
+        row = conn.execute(f"SELECT {score_col} FROM players WHERE name=?", (name,)).fetchone()
+        if row is None:
+            return
 
-    if row is None:
-        conn.close()
-        return
-
-    prev = row[score_col] if row[score_col] is not None else 0
-    if score > prev:
-        cur.execute(f"""
-            UPDATE players
-            SET {score_col}=?,
-                {time_col}=?
-            WHERE name=?
-        """, (score, datetime.datetime.now().isoformat(), name))
-        conn.commit()
-    conn.close()
+        prev = row[score_col] if row[score_col] is not None else 0
+        if score > prev:
+            conn.execute(f"""
+                UPDATE players
+                SET {score_col}=?,
+                    {time_col}=?
+                WHERE name=?
+            """, (score, datetime.datetime.now().isoformat(), name))
 
 def get_leaderboard(mode="mode1", limit=10):
     if mode not in ("mode1", "mode2"):
         raise ValueError("mode must be 'mode1' or 'mode2'")
     score_col = f"{mode}_high_score"
-    conn = get_connection(); cur = conn.cursor()
-    cur.execute(f"SELECT name, {score_col} as high_score, {mode}_score_time as score_time FROM players ORDER BY {score_col} DESC LIMIT ?", (limit,))
-    rows = cur.fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(f"SELECT name, {score_col} as high_score, {mode}_score_time as score_time FROM players ORDER BY {score_col} DESC LIMIT ?", (limit,)).fetchall()
     return [dict(r) for r in rows]
 
 
 # ---------------- WORDS API ----------------
+def _word_ids_of_length(length):
+    with connection() as conn:
+        return [r[0] for r in conn.execute("SELECT id FROM words WHERE length=?", (length,))]
+
+# in-memory id buckets for get_word_of_length; invalidated on every write
+_sampler = WordSampler(_word_ids_of_length)
+
 def insert_word(word, meaning, audio_path):
-    conn = get_connection(); cur = conn.cursor()
     try:
-        cur.execute("""
-            INSERT OR IGNORE INTO words (word, meaning, audio_path, length)
-            VALUES (?, ?, ?, ?)
-        """, (word.upper(), meaning, audio_path, len(word)))
-        conn.commit()
+        with transaction() as conn:
+            conn.execute("""
+                INSERT OR IGNORE INTO words (word, meaning, audio_path, length)
+                VALUES (?, ?, ?, ?)
+            """, (word.upper(), meaning, audio_path, len(word)))
+        _sampler.invalidate(len(word))
     except Exception as e:
         print("Word insert error:", e)
-    conn.close()
 
-def get_word_of_length(length):
-    conn = get_connection(); cur = conn.cursor()
-    cur.execute("""
-        SELECT * FROM words
-        WHERE length=?
-        ORDER BY RANDOM()
-        LIMIT 1
-    """, (length,))
-    row = cur.fetchone()
-    conn.close()
+def _word_indexes(conn):
+    """(name, CREATE sql) of the explicit, droppable indexes on words."""
+    return [(r[0], r[1]) for r in conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name='words' AND sql IS NOT NULL")]
+
+_DROPPED_INDEXES_KEY = "dropped_word_indexes"
+
+def _restore_word_indexes():
+    """Recreate indexes a bulk load dropped (also after a crash, from init_db)."""
+    pending = get_meta(_DROPPED_INDEXES_KEY)
+    if not pending:
+        return
+    with transaction() as conn:
+        _begin(conn)
+        existing = {name for name, _ in _word_indexes(conn)}
+        for name, sql in json.loads(pending):
+            if name not in existing:
+                conn.execute(sql)
+        set_meta(_DROPPED_INDEXES_KEY, None)
+
+def insert_words_bulk(rows, chunk_size=5000, progress_callback=None, checkpoint=None):
+    """
+    Insert many (word, meaning, audio_path) rows quickly.
+
+    Rows are streamed through executemany in chunks of `chunk_size`
+    (chunk_size=None loads everything in one transaction). Secondary
+    indexes are dropped for the load and rebuilt afterwards; the UNIQUE
+    index on word stays so duplicates are still ignored.
+    progress_callback(rows_seen) is called after each committed chunk.
+    checkpoint(rows_seen) runs inside each chunk's transaction, so whatever it
+    writes (e.g. a resume marker via set_meta) commits atomically with the rows.
+    Returns {"rows": inserted, "seconds": elapsed, "rows_per_sec": rate}.
+    """
+    def normalized():
+        for word, meaning, audio_path in rows:
+            w = word.upper()
+            yield (w, meaning, audio_path, len(w))
+
+    start = time.perf_counter()
+    stream = normalized()
+    seen = 0
+    inserted = 0
+    with connection() as conn:
+        indexes = _word_indexes(conn)
+        with transaction():
+            _begin(conn)
+            # remembered in meta so a crash mid-load can't leave them missing
+            set_meta(_DROPPED_INDEXES_KEY, json.dumps(indexes) if indexes else None)
+            for name, _ in indexes:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            while True:
+                chunk = list(itertools.islice(stream, chunk_size)) if chunk_size else list(stream)
+                if not chunk:
+                    break
+                with transaction():
+                    before = conn.total_changes
+                    conn.executemany("""
+                        INSERT OR IGNORE INTO words (word, meaning, audio_path, length)
+                        VALUES (?, ?, ?, ?)
+                    """, chunk)
+                    inserted += conn.total_changes - before
+                    seen += len(chunk)
+                    if checkpoint:
+                        checkpoint(seen)
+                if progress_callback:
+                    progress_callback(seen)
+                if not chunk_size:
+                    break
+        finally:
+            _restore_word_indexes()
+            _sampler.invalidate()
+
+    elapsed = time.perf_counter() - start
+    return {"rows": inserted, "seconds": elapsed,
+            "rows_per_sec": inserted / elapsed if elapsed > 0 else 0.0}
+
+def get_word_of_length(length, no_repeat=False):
+    """
+    Random word of the given length, or None.
+    no_repeat=True draws from a per-length shuffle bag so no word repeats
+    until the bucket is exhausted (see reset_word_session()).
+    """
+    for _ in range(2):
+        word_id = _sampler.pick_id(length, no_repeat=no_repeat)
+        if word_id is None:
+            return None
+        with connection() as conn:
+            row = conn.execute("SELECT * FROM words WHERE id=?", (word_id,)).fetchone()
+        if row:
+            return dict(row)
+        # id vanished behind our back (another process edited the table)
+        _sampler.invalidate(length)
+    return None
+
+def reset_word_session():
+    """Start a new no-repeat session for get_word_of_length(no_repeat=True)."""
+    _sampler.reset_bags()
+
+def get_word_entry(word):
+    """Exact lookup of a word (case-insensitive). Returns dict or None."""
+    with connection() as conn:
+        row = conn.execute("SELECT * FROM words WHERE word = ?", (word.upper(),)).fetchone()
     return dict(row) if row else None
 
 def count_words():
-    conn = get_connection(); cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) as total FROM words")
-    total = cur.fetchone()["total"]
-    conn.close()
+    with connection() as conn:
+        total = conn.execute("SELECT COUNT(*) as total FROM words").fetchone()["total"]
     return total
 
 def clear_words():
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM words")
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        conn.execute("DELETE FROM words")
+    _sampler.invalidate()
+
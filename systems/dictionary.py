@@ -0,0 +1,267 @@
+# systems/dictionary.py
+# In-memory word dictionary (array-backed trie) built from the words table.
+#
+# Nodes live in flat arrays (first child / next sibling / letter / entry),
+# so the whole trie is a handful of buffers instead of a dict per node, and
+# it can be written to and read back from disk in one go.
+import os, struct, threading
+from array import array
+from systems import db_manager
+
+CACHE_NAME = "dictionary.bin"   # written next to the SQLite database
+# Bump whenever the file layout or the build rules (which words are kept)
+# change, so caches written by an older build are rebuilt instead of reused.
+_MAGIC = b"SVDICT02"
+
+ROOT = 0
+NO_NODE = -1
+
+
+class WordDictionary:
+    """
+    Trie over uppercase A-Z words with the word's id / meaning / audio_path
+    attached to terminal nodes.
+
+    Node walking (for live prefix checks and the board solver):
+        node = d.step(ROOT, "C"); node = d.step(node, "A") ...
+        d.is_word(node), d.entry_index(node)
+    """
+
+    def __init__(self):
+        # nodes
+        self.first_child = array("i", [NO_NODE])
+        self.next_sibling = array("i", [NO_NODE])
+        self.letter = bytearray(b"\0")
+        self.terminal = array("i", [-1])       # entry index, or -1
+        # entries (index = insertion order of sorted words)
+        self.ids = array("q")
+        self._words = _StringTable()
+        self._meanings = _StringTable()
+        self._audio = _StringTable()
+        self.signature = (0, 0)                 # (word count, max id) of the source table
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ---------- building ----------
+    @classmethod
+    def build(cls, rows, signature=(0, 0)):
+        """rows: iterable of (id, word, meaning, audio_path)."""
+        d = cls()
+        d.signature = tuple(signature)
+        rows = sorted(((w.upper(), i, m, a) for i, w, m, a in rows
+                       if w and w.isascii() and w.isalpha()), key=lambda r: r[0])
+        last_child = array("i", [NO_NODE])
+        path = [ROOT]              # nodes of the previous word, root first
+        prev = ""
+        words, meanings, audio = [], [], []
+
+        for word, word_id, meaning, audio_path in rows:
+            if word == prev:
+                continue
+            lcp = 0
+            for a, b in zip(prev, word):
+                if a != b:
+                    break
+                lcp += 1
+            del path[lcp + 1:]
+            for ch in word[lcp:]:
+                parent = path[-1]
+                node = len(d.letter)
+                d.first_child.append(NO_NODE)
+                d.next_sibling.append(NO_NODE)
+                d.letter.append(ord(ch))
+                d.terminal.append(-1)
+                last_child.append(NO_NODE)
+                if d.first_child[parent] == NO_NODE:
+                    d.first_child[parent] = node
+                else:
+                    d.next_sibling[last_child[parent]] = node
+                last_child[parent] = node
+                path.append(node)
+            d.terminal[path[-1]] = len(d.ids)
+            d.ids.append(word_id)
+            words.append(word)
+            meanings.append(meaning or "")
+            audio.append(audio_path or "")
+            prev = word
+
+        d._words = _StringTable.from_list(words)
+        d._meanings = _StringTable.from_list(meanings)
+        d._audio = _StringTable.from_list(audio)
+        return d
+
+    @classmethod
+    def from_db(cls):
+        with db_manager.connection() as conn:
+            signature = _db_signature(conn)
+            rows = conn.execute("SELECT id, word, meaning, audio_path FROM words").fetchall()
+        return cls.build(((r[0], r[1], r[2], r[3]) for r in rows), signature)
+
+    # ---------- walking ----------
+    def step(self, node, ch):
+        """Child of `node` for letter `ch`, or NO_NODE."""
+        if node == NO_NODE:
+            return NO_NODE
+        code = ord(ch)
+        child = self.first_child[node]
+        letter = self.letter
+        while child != NO_NODE:
+            c = letter[child]
+            if c == code:
+                return child
+            if c > code:        # siblings are sorted
+                return NO_NODE
+            child = self.next_sibling[child]
+        return NO_NODE
+
+    def walk(self, text, node=ROOT):
+        for ch in text.upper():
+            node = self.step(node, ch)
+            if node == NO_NODE:
+                break
+        return node
+
+    def is_word(self, node):
+        return node != NO_NODE and self.terminal[node] >= 0
+
+    def entry_index(self, node):
+        return self.terminal[node] if node != NO_NODE else -1
+
+    # ---------- lookups ----------
+    def contains(self, word):
+        return self.is_word(self.walk(word))
+
+    def has_prefix(self, prefix):
+        return self.walk(prefix) != NO_NODE
+
+    def lookup(self, word):
+        """Entry dict (like a words row) for an exact word, or None."""
+        idx = self.entry_index(self.walk(word))
+        return self.entry(idx) if idx >= 0 else None
+
+    def word(self, index):
+        return self._words.get(index)
+
+    def entry(self, index):
+        word = self._words.get(index)
+        return {
+            "id": self.ids[index],
+            "word": word,
+            "meaning": self._meanings.get(index) or None,
+            "audio_path": self._audio.get(index) or None,
+            "length": len(word),
+        }
+
+    # ---------- persistence ----------
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<qq", *self.signature))
+            for arr in (self.first_child, self.next_sibling, self.terminal, self.ids):
+                _write_array(f, arr)
+            _write_bytes(f, bytes(self.letter))
+            for table in (self._words, self._meanings, self._audio):
+                _write_array(f, table.offsets)
+                _write_bytes(f, table.blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        d = cls()
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("not a dictionary cache: %s" % path)
+            d.signature = struct.unpack("<qq", f.read(16))
+            d.first_child, d.next_sibling, d.terminal, d.ids = (_read_array(f) for _ in range(4))
+            d.letter = bytearray(_read_bytes(f))
+            d._words, d._meanings, d._audio = (
+                _StringTable(_read_array(f), _read_bytes(f)) for _ in range(3))
+        return d
+
+    def memory_bytes(self):
+        arrays = (self.first_child, self.next_sibling, self.terminal, self.ids)
+        total = sum(a.itemsize * len(a) for a in arrays) + len(self.letter)
+        for t in (self._words, self._meanings, self._audio):
+            total += t.offsets.itemsize * len(t.offsets) + len(t.blob)
+        return total
+
+
+class _StringTable:
+    """Many strings stored as one UTF-8 blob plus an offsets array."""
+
+    def __init__(self, offsets=None, blob=b""):
+        self.offsets = offsets if offsets is not None else array("q", [0])
+        self.blob = blob
+
+    @classmethod
+    def from_list(cls, strings):
+        offsets = array("q", [0])
+        parts = []
+        pos = 0
+        for s in strings:
+            b = s.encode("utf-8")
+            parts.append(b)
+            pos += len(b)
+            offsets.append(pos)
+        return cls(offsets, b"".join(parts))
+
+    def get(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+
+def _write_array(f, arr):
+    f.write(struct.pack("<cq", arr.typecode.encode(), len(arr)))
+    arr.tofile(f)
+
+def _read_array(f):
+    typecode, n = struct.unpack("<cq", f.read(9))
+    arr = array(typecode.decode())
+    arr.fromfile(f, n)
+    return arr
+
+def _write_bytes(f, data):
+    f.write(struct.pack("<q", len(data)))
+    f.write(data)
+
+def _read_bytes(f):
+    (n,) = struct.unpack("<q", f.read(8))
+    return f.read(n)
+
+def _db_signature(conn):
+    row = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM words").fetchone()
+    return (row[0], row[1])
+
+
+# ---------- shared instance ----------
+_dictionary = None
+_lock = threading.Lock()
+
+def get_dictionary(cache_path=None):
+    """
+    The process-wide dictionary. Loaded from the on-disk cache when it still
+    matches the words table, otherwise rebuilt from SQLite and re-cached.
+    """
+    global _dictionary
+    cache_path = cache_path or os.path.join(os.path.dirname(db_manager.DB_PATH), CACHE_NAME)
+    with _lock:
+        with db_manager.connection() as conn:
+            signature = _db_signature(conn)
+        if _dictionary is not None and _dictionary.signature == signature:
+            return _dictionary
+        d = None
+        try:
+            cached = WordDictionary.load(cache_path)
+            if cached.signature == signature:
+                d = cached
+        except (OSError, ValueError, EOFError, struct.error):
+            pass
+        if d is None:
+            d = WordDictionary.from_db()
+            try:
+                d.save(cache_path)
+            except OSError as e:
+                print("Dictionary cache write error:", e)
+        _dictionary = d
+        return d
@@ -0,0 +1,74 @@
+# systems/dirty_rects.py
+# Dirty-region bookkeeping for the game loops: remember what each screen
+# element looked like last frame, repaint only the regions that changed and
+# hand exactly those rects to pygame.display.update().
+import pygame
+
+
+class DirtyRegions:
+    """
+    Usage per frame:
+        regions.track(key, value, rect)    # for every board cell / HUD / overlay
+        area = regions.area()              # None when nothing changed
+        if area: draw the frame clipped to `area`
+        regions.present()                  # display.update(dirty rects)
+
+    Anything drawn outside this bookkeeping (blocking animations, popups)
+    must call mark_all() so the next frame repaints everything.
+    """
+
+    def __init__(self, size):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self._dirty = []
+        self._full = True
+        self._last = {}          # key -> (value, rect)
+        self.frames = 0
+        self.idle_frames = 0
+
+    def mark(self, rect):
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.w and rect.h:
+            self._dirty.append(rect)
+
+    def mark_all(self):
+        self._full = True
+
+    def track(self, key, value, rect):
+        """Mark `rect` (and where the element was last frame) dirty if `value` changed."""
+        prev = self._last.get(key)
+        if prev is not None and prev[0] == value and prev[1] == rect:
+            return
+        self.mark(rect)
+        if prev is not None:
+            self.mark(prev[1])
+        self._last[key] = (value, pygame.Rect(rect))
+
+    def forget(self):
+        """Drop remembered values (e.g. when a new game starts)."""
+        self._last.clear()
+        self.mark_all()
+
+    def rects(self):
+        if self._full:
+            return [self.screen_rect.copy()]
+        return list(self._dirty)
+
+    def area(self):
+        """Bounding rect of this frame's dirty regions, or None if idle."""
+        if self._full:
+            return self.screen_rect.copy()
+        if not self._dirty:
+            return None
+        return self._dirty[0].unionall(self._dirty[1:])
+
+    def present(self):
+        """Push the dirty regions to the display and start a new frame."""
+        rects = self.rects()
+        self.frames += 1
+        if rects:
+            pygame.display.update(rects)
+        else:
+            self.idle_frames += 1
+        self._dirty = []
+        self._full = False
+        return rects
@@ -0,0 +1,105 @@
+# systems/frame_pacer.py
+# Adaptive frame pacing: full frame rate while something moves, and
+# event-driven waiting (pygame.event.wait with a timeout) once a screen has
+# been idle for a moment. Also tracks process CPU% per screen.
+import time
+import pygame
+
+IDLE_AFTER = 0.5          # seconds without changes before a screen counts as idle
+IDLE_WAKE_MS = 250        # longest sleep while idle (cursor blinks, overlays, timers)
+CPU_SAMPLE_SECONDS = 1.0
+
+_cpu_percent = {}         # screen -> process CPU% over the last sample
+_presenter = None         # pacer that last put a frame on the display
+_woken = []               # event that ended an idle wait, not yet handed to the loop
+
+
+class FramePacer:
+    """
+    Usage per frame:
+        if pacer.changed(*what_the_screen_shows):
+            draw ...; pygame.display.update()
+        pacer.wait("main menu")             # instead of clock.tick(fps)
+
+    The loop reads its events with get_events() instead of
+    pygame.event.get(), so the event that woke an idle wait comes first.
+
+    Loops that track changes themselves call mark_active() instead of
+    changed(). changed() also returns True when another screen drew
+    since this one last did (e.g. after returning from a sub-menu).
+    """
+
+    def __init__(self, fps, clock=None, idle_after=IDLE_AFTER, idle_wake_ms=IDLE_WAKE_MS):
+        self.fps = fps
+        self.clock = clock or pygame.time.Clock()
+        self.idle_after = idle_after
+        self.idle_wake_ms = idle_wake_ms
+        self._key = None
+        self._last_active = time.perf_counter()
+        self._sample = None          # (screen, wall, cpu) at the start of the current CPU sample
+        self.idle_frames = 0
+
+    # ---------- change tracking ----------
+    def changed(self, *key):
+        """True (and marks the screen active) when `key` differs from the last drawn frame."""
+        global _presenter
+        if key == self._key and _presenter is self:
+            return False
+        self._key = key
+        _presenter = self
+        self.mark_active()
+        return True
+
+    def invalidate(self):
+        self._key = None
+
+    def mark_active(self):
+        self._last_active = time.perf_counter()
+
+    @property
+    def idle(self):
+        return time.perf_counter() - self._last_active >= self.idle_after
+
+    # ---------- pacing ----------
+    def wait(self, screen=""):
+        """End the frame: tick at full rate while active, else sleep until an event or timeout."""
+        global _presenter
+        _presenter = self
+        if not self.idle:
+            self.clock.tick(self.fps)
+        else:
+            self.idle_frames += 1
+            event = pygame.event.wait(self.idle_wake_ms)
+            if event.type != pygame.NOEVENT:
+                # kept aside rather than re-posted: posting would queue it
+                # behind events that arrived after it
+                _woken.append(event)
+                self.mark_active()
+            self.clock.tick()
+        self._sample_cpu(screen)
+
+    def _sample_cpu(self, screen):
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self._sample is None or self._sample[0] != screen:
+            self._sample = (screen, wall, cpu)
+            return
+        _, wall0, cpu0 = self._sample
+        if wall - wall0 >= CPU_SAMPLE_SECONDS:
+            _cpu_percent[screen] = (cpu - cpu0) / (wall - wall0) * 100
+            self._sample = (screen, wall, cpu)
+
+
+def get_events():
+    """pygame.event.get(), preceded by the event that ended the last idle wait."""
+    events = _woken + pygame.event.get()
+    _woken.clear()
+    return events
+
+
+def cpu_percent(screen):
+    """Process CPU% measured on `screen` over the last sample (None if not measured yet)."""
+    return _cpu_percent.get(screen)
+
+def cpu_report():
+    """{screen: CPU%} for every screen measured so far."""
+    return dict(_cpu_percent)
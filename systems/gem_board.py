@@ -0,0 +1,426 @@
+# systems/gem_board.py
+# Board engine for mode1: the gem grid as one flat signed-byte array
+# (cell = x * height + y, the layout board_solver uses for mode2), with
+# match finding, gravity and refill working in place or in one reusable
+# scratch buffer instead of deep-copying nested lists.
+#
+# Semantics match the original mode1 helpers exactly, including the order
+# of random.choice() calls when refilling, so a seeded game plays the same.
+#
+# Match finding is incremental: the board keeps, per row and per column, the
+# cells that sit in a run of 3+, and its own writes (board[x, y] = ..., swap,
+# apply_moves, gravity, shuffle) mark the lines they touch. find_matches()
+# recomputes only those lines, so a swap costs two rows and two columns
+# rather than a board scan.
+#
+# When NumPy is installed, boards of NUMPY_MIN_CELLS cells or more rebuild
+# that state with shifted-array comparisons when every line is dirty, and
+# can_make_moves() / has_matches() test a whole batch of candidate boards
+# at once (see the NumPy section below); the results are the same either way.
+import random
+from array import array
+
+# NumPy is optional; the pure-Python path is always available.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+EMPTY = -1
+ROW_ABOVE = -1      # MovingGem.y of a gem entering from above the board
+NUMPY_MIN_CELLS = 144   # below this (mode1's 8x8) the Python loops are faster
+
+# canMakeMove's one-off patterns: two gems in line, a third one step off
+_ONE_OFF_PATTERNS = (((0,1), (1,0), (2,0)),
+                     ((0,1), (1,1), (2,0)),
+                     ((0,0), (1,1), (2,0)),
+                     ((0,1), (1,0), (2,1)),
+                     ((0,0), (1,0), (2,1)),
+                     ((0,0), (1,1), (2,1)),
+                     ((0,0), (0,2), (0,3)),
+                     ((0,0), (0,1), (0,3)))
+
+_MOVE_TRIPLES = {}
+
+
+def _move_triples(width, height):
+    """Cell-index triples of every in-bounds pattern placement, in the original probe order."""
+    key = (width, height)
+    triples = _MOVE_TRIPLES.get(key)
+    if triples is None:
+        triples = []
+        inside = lambda x, y: 0 <= x < width and 0 <= y < height
+        for x in range(width):
+            for y in range(height):
+                for pat in _ONE_OFF_PATTERNS:
+                    for cells in (pat, tuple((b, a) for a, b in pat)):
+                        pts = [(x + dx, y + dy) for dx, dy in cells]
+                        if all(inside(px, py) for px, py in pts):
+                            triples.append(tuple(px * height + py for px, py in pts))
+        triples = _MOVE_TRIPLES[key] = tuple(triples)
+    return triples
+
+
+_SCAN_ORDERS = {}
+
+
+def _scan_order(width, height):
+    """(cell index, x, y) for every cell, column by column."""
+    key = (width, height)
+    if key not in _SCAN_ORDERS:
+        _SCAN_ORDERS[key] = [(x * height + y, x, y) for x in range(width) for y in range(height)]
+    return _SCAN_ORDERS[key]
+
+
+def _line_runs(line, start, step):
+    """Cell indices in runs of 3+ on one row or column; `line` holds its cells, the first at index `start`."""
+    covered = set()
+    for k, (a, b, c) in enumerate(zip(line, line[1:], line[2:])):
+        if a == b == c != EMPTY:
+            covered.update((start + k * step, start + (k + 1) * step, start + (k + 2) * step))
+    return sorted(covered)
+
+
+class MovingGem:
+    """A gem sliding one cell in direction (dx, dy); y == ROW_ABOVE enters from the top."""
+    __slots__ = ("x", "y", "image", "dx", "dy")
+
+    def __init__(self, x, y, image, dx=0, dy=1):
+        self.x, self.y, self.image, self.dx, self.dy = x, y, image, dx, dy
+
+    def __repr__(self):
+        return f"MovingGem({self.x}, {self.y}, {self.image}, {self.dx}, {self.dy})"
+
+
+class GemBoard:
+    """
+    board[x, y] reads / writes one cell; get(x, y) returns None off the
+    board. `cells` is the flat array itself, for loops that walk every cell;
+    call invalidate() after writing to it directly.
+    """
+    __slots__ = ("width", "height", "cells", "_scratch",
+                 "_col_runs", "_row_runs", "_dirty_cols", "_dirty_rows")
+
+    def __init__(self, width, height, cells=None):
+        self.width, self.height = width, height
+        self.cells = array("b", cells if cells is not None else [EMPTY] * (width * height))
+        self._scratch = array("b", self.cells)
+        self._col_runs = [()] * width       # per column: cell indices in runs of 3+ along y
+        self._row_runs = [()] * height      # per row: cell indices in runs of 3+ along x
+        self.invalidate()
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Board from the old list-of-columns layout (columns[x][y])."""
+        return cls(len(columns), len(columns[0]), [v for col in columns for v in col])
+
+    def to_columns(self):
+        h = self.height
+        return [self.cells[x * h:(x + 1) * h].tolist() for x in range(self.width)]
+
+    def copy(self):
+        board = GemBoard(self.width, self.height, self.cells)
+        board._col_runs, board._row_runs = list(self._col_runs), list(self._row_runs)
+        board._dirty_cols, board._dirty_rows = set(self._dirty_cols), set(self._dirty_rows)
+        return board
+
+    def __eq__(self, other):
+        return isinstance(other, GemBoard) and self.cells == other.cells and self.height == other.height
+
+    def __getitem__(self, pos):
+        return self.cells[pos[0] * self.height + pos[1]]
+
+    def __setitem__(self, pos, value):
+        self.cells[pos[0] * self.height + pos[1]] = value
+        self._dirty_cols.add(pos[0])
+        self._dirty_rows.add(pos[1])
+
+    def get(self, x, y):
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return None
+        return self.cells[x * self.height + y]
+
+    def swap(self, a, b):
+        h, cells = self.height, self.cells
+        i, j = a[0] * h + a[1], b[0] * h + b[1]
+        cells[i], cells[j] = cells[j], cells[i]
+        self._dirty_cols.update((a[0], b[0]))
+        self._dirty_rows.update((a[1], b[1]))
+
+    # ---------- run state ----------
+    def invalidate(self):
+        """Mark every line dirty (after writing `cells` directly)."""
+        self._dirty_cols = set(range(self.width))
+        self._dirty_rows = set(range(self.height))
+
+    def _mostly_dirty(self):
+        return len(self._dirty_cols) + len(self._dirty_rows) > (self.width + self.height) // 2
+
+    def _clear_runs(self):
+        """No runs anywhere (a full scan found no match): every line's state is known again."""
+        self._col_runs = [()] * self.width
+        self._row_runs = [()] * self.height
+        self._dirty_cols.clear()
+        self._dirty_rows.clear()
+
+    def _refresh_runs(self):
+        """Recompute the runs of the dirty lines."""
+        cols, rows = self._dirty_cols, self._dirty_rows
+        if not cols and not rows:
+            return
+        w, h = self.width, self.height
+        if _use_numpy(self) and self._mostly_dirty():
+            along_x, along_y = run_masks(as_grid(self))
+            self._col_runs = col_runs = [[] for _ in range(w)]
+            self._row_runs = row_runs = [[] for _ in range(h)]
+            for i in np.flatnonzero(along_y).tolist():      # flat index == cell index
+                col_runs[i // h].append(i)
+            for i in np.flatnonzero(along_x).tolist():
+                row_runs[i % h].append(i)
+        else:
+            cells = self.cells
+            for x in cols:
+                self._col_runs[x] = _line_runs(cells[x * h:(x + 1) * h], x * h, 1)
+            for y in rows:
+                self._row_runs[y] = _line_runs(cells[y::h], y, h)
+        cols.clear()
+        rows.clear()
+
+    # ---------- matching ----------
+    def find_matches(self):
+        """
+        Runs of 3+ equal gems as lists of (x, y). Scanned column by column;
+        a gem already in a run is not counted again (so a cross yields the
+        horizontal run plus the rest of the vertical one).
+        """
+        if self._mostly_dirty() and not _use_numpy(self):
+            # after a refill most lines changed: one plain scan beats refreshing them
+            groups = self.find_matches_py()
+            if not groups:
+                self._clear_runs()
+            return groups
+        self._refresh_runs()
+        covered = [i for runs in (self._col_runs, self._row_runs) for line in runs for i in line]
+        if not covered:
+            return []
+        # a scan can only start or extend a run on a covered cell
+        return self.find_matches_py(sorted(set(covered)))
+
+    def can_make_move(self):
+        """
+        True if some single swap would line up three gems. Stays in Python:
+        it stops at the first move found, which on a playable board beats
+        comparing every pattern at once. can_make_moves() checks batches.
+        """
+        return self.can_make_move_py()
+
+    def find_matches_py(self, cells_to_scan=None):
+        """find_matches() in pure Python; `cells_to_scan` limits the scan to those cell indices (ascending)."""
+        w, h = self.width, self.height
+        cells = self._scratch
+        cells[:] = self.cells
+        groups = []
+        order = _scan_order(w, h)
+        if cells_to_scan is not None:
+            order = [order[i] for i in cells_to_scan]
+        for i, x, y in order:
+            base = i - y
+            t = cells[i]
+            if t != EMPTY and x + 2 < w and cells[i + h] == t and cells[i + 2 * h] == t:
+                run = []
+                j = i
+                while j < w * h and cells[j] == t:
+                    run.append((j // h, y))
+                    cells[j] = EMPTY
+                    j += h
+                groups.append(run)
+            t = cells[i]
+            if t != EMPTY and y + 2 < h and cells[i + 1] == t and cells[i + 2] == t:
+                run = []
+                j = i
+                while j < base + h and cells[j] == t:
+                    run.append((x, j - base))
+                    cells[j] = EMPTY
+                    j += 1
+                groups.append(run)
+        return groups
+
+    def can_make_move_py(self):
+        """can_make_move() in pure Python."""
+        cells = self.cells
+        for a, b, c in _move_triples(self.width, self.height):
+            if cells[a] == cells[b] == cells[c]:
+                return True
+        return False
+
+    # ---------- gravity + refill ----------
+    def gravity(self, cells=None):
+        """Let every gem fall to the bottom of its column (in place)."""
+        own = cells is None
+        cells = self.cells if own else cells
+        h = self.height
+        for base in range(0, self.width * h, h):
+            old = cells[base:base + h]
+            col = [v for v in old if v != EMPTY]
+            if len(col) < h:
+                new = array("b", [EMPTY] * (h - len(col)) + col)
+                cells[base:base + h] = new
+                if own and new != old:
+                    self._dirty_cols.add(base // h)
+                    self._dirty_rows.update(y for y in range(h) if new[y] != old[y])
+
+    def drop_slots(self, n_images, rng=random):
+        """
+        New gems per column (bottom-most first) that refill the board once
+        gravity has run; each differs from its 4 neighbours where possible.
+        The board itself is left unchanged.
+        """
+        w, h = self.width, self.height
+        cells = self._scratch
+        cells[:] = self.cells
+        self.gravity(cells)
+        slots = [[] for _ in range(w)]
+        for x in range(w):
+            base = x * h
+            for y in range(h - 1, -1, -1):
+                i = base + y
+                if cells[i] != EMPTY:
+                    continue
+                possible = list(range(n_images))
+                for n in (cells[i - 1] if y > 0 else None,
+                          cells[i + h] if x + 1 < w else None,
+                          cells[i + 1] if y + 1 < h else None,
+                          cells[i - h] if x > 0 else None):
+                    if n in possible:
+                        possible.remove(n)
+                gem = rng.choice(possible)
+                cells[i] = gem
+                slots[x].append(gem)
+        return slots
+
+    def dropping_gems(self):
+        """MovingGems for every gem with an empty cell somewhere below it."""
+        h, cells = self.height, self.cells
+        dropping = []
+        for x in range(self.width):
+            base = x * h
+            hole = cells[base + h - 1] == EMPTY
+            for y in range(h - 2, -1, -1):
+                v = cells[base + y]
+                if v == EMPTY:
+                    hole = True
+                elif hole:
+                    dropping.append(MovingGem(x, y, v, 0, 1))
+        return dropping
+
+    def apply_moves(self, moving):
+        """Move each gem one cell (in list order); entering gems land in row 0."""
+        h, cells = self.height, self.cells
+        cols = self._dirty_cols
+        top, bottom = h, -1
+        for g in moving:
+            x, y = g.x, g.y
+            if y != ROW_ABOVE:
+                cells[x * h + y] = EMPTY
+                cells[(x + g.dx) * h + y + g.dy] = g.image
+                if g.dx:
+                    cols.add(x + g.dx)
+                lo, hi = (y, y + g.dy) if g.dy >= 0 else (y + g.dy, y)
+            else:
+                cells[x * h] = g.image
+                lo = hi = 0
+            cols.add(x)
+            if lo < top: top = lo
+            if hi > bottom: bottom = hi
+        if moving:
+            self._dirty_rows.update(range(top, bottom + 1))
+
+    def shuffle(self, rng=random):
+        """Shuffle the columns, then the gems inside each column."""
+        columns = self.to_columns()
+        rng.shuffle(columns)
+        for col in columns:
+            rng.shuffle(col)
+        self.cells[:] = array("b", [v for col in columns for v in col])
+        self.invalidate()
+
+
+# ---------- NumPy path ----------
+# Boards as int8 arrays of shape (width, height), or (n, width, height) for a
+# batch of candidate boards; axis -2 is x, axis -1 is y.
+
+def _use_numpy(board):
+    return NUMPY_AVAILABLE and board.width * board.height >= NUMPY_MIN_CELLS
+
+
+def as_grid(board):
+    """The board's cells as a (width, height) int8 array (a view, not a copy)."""
+    return np.frombuffer(board.cells, dtype=np.int8).reshape(board.width, board.height)
+
+
+def stack_grids(boards):
+    """(n, width, height) array of equally sized boards, for the batch functions."""
+    return np.stack([as_grid(b) for b in boards])
+
+
+def run_masks(grids):
+    """(along_x, along_y): True for every cell inside a run of 3+ equal (non-empty) gems along that axis."""
+    g = np.asarray(grids)
+    w, h = g.shape[-2:]
+    along_x = np.zeros(g.shape, dtype=bool)
+    along_y = np.zeros(g.shape, dtype=bool)
+    if w >= 3:
+        run = (g[..., :-2, :] == g[..., 1:-1, :]) & (g[..., 1:-1, :] == g[..., 2:, :]) & (g[..., :-2, :] != EMPTY)
+        for k in range(3):
+            along_x[..., k:w - 2 + k, :] |= run
+    if h >= 3:
+        run = (g[..., :-2] == g[..., 1:-1]) & (g[..., 1:-1] == g[..., 2:]) & (g[..., :-2] != EMPTY)
+        for k in range(3):
+            along_y[..., k:h - 2 + k] |= run
+    return along_x, along_y
+
+
+def match_masks(grids):
+    """True for every cell inside a run of 3+ equal (non-empty) gems."""
+    along_x, along_y = run_masks(grids)
+    return along_x | along_y
+
+
+def has_matches(grids):
+    """Per board: does it hold a run of 3+? (a bool for one board, an array for a batch)"""
+    return match_masks(grids).any(axis=(-2, -1))
+
+
+def can_make_moves(grids):
+    """Per board: would some single swap line up three gems? Same test as can_make_move_py()."""
+    g = np.asarray(grids)
+    w, h = g.shape[-2:]
+    a, b, c = _triple_indices(w, h)
+    flat = g.reshape(g.shape[:-2] + (w * h,))
+    va, vb, vc = flat[..., a], flat[..., b], flat[..., c]
+    return ((va == vb) & (vb == vc)).any(axis=-1)
+
+
+_TRIPLE_INDICES = {}
+
+
+def _triple_indices(width, height):
+    """_move_triples() as three index arrays, one per pattern cell."""
+    key = (width, height)
+    if key not in _TRIPLE_INDICES:
+        triples = np.array(_move_triples(width, height), dtype=np.intp).reshape(-1, 3)
+        _TRIPLE_INDICES[key] = (triples[:, 0], triples[:, 1], triples[:, 2])
+    return _TRIPLE_INDICES[key]
+
+
+def find_matches_np(board):
+    """
+    find_matches() for one GemBoard: NumPy finds the cells that sit in any
+    run, and only those cells are scanned in order to build the groups
+    (a scan can only start or extend a run on such a cell).
+    """
+    mask = match_masks(as_grid(board))
+    if not mask.any():
+        return []
+    return board.find_matches_py(np.flatnonzero(mask).tolist())
@@ -0,0 +1,120 @@
+# systems/hud.py
+# Retained-mode HUD panel shared by both game modes.
+#
+# The glass panel, static labels and icons are drawn once into a chrome
+# surface. The panel is only recomposed when one of its values (player,
+# score, word, meaning) changes; otherwise a frame costs a single blit.
+import pygame
+from systems import text_cache
+
+WORD_LABEL_COLOR = (240, 240, 250)
+WORD_COLOR = (255, 215, 80)
+MEANING_COLOR = (200, 200, 200)
+VALUE_COLOR = (255, 255, 255)
+NO_MEANING = "Meaning not available."
+
+
+class HudPanel:
+    """
+    Bottom HUD: word + wrapped meaning on top, player | score | back below.
+
+    wrap(text, font, max_width) is the mode's own word-wrap; its result is
+    cached per meaning string. score_value_x=None places the score right
+    after its label.
+    """
+
+    def __init__(self, width, height, pos, player_icon, back_icon, back_x, wrap,
+                 bg_color=(35, 35, 55, 165), border_color=(255, 255, 255, 55),
+                 score_label_color=(230, 230, 240), score_value_x=None,
+                 padding=(30, 22)):
+        self.width, self.height = width, height
+        self.pos = pos
+        self.player_icon, self.back_icon = player_icon, back_icon
+        self.back_x = back_x
+        self.wrap = wrap
+        self.bg_color, self.border_color = bg_color, border_color
+        self.score_label_color = score_label_color
+        self.score_value_x = score_value_x
+        self.px, self.py = padding
+
+        self._chrome = None
+        self._surface = None
+        self._values = None
+        self._wrapped = {}        # meaning -> wrapped lines
+        self.recomposes = 0
+
+    @property
+    def back_rect(self):
+        """Back button in screen coordinates."""
+        return pygame.Rect(self.pos[0] + self.back_x, self.pos[1] + self.py + 70 - 6,
+                           self.back_icon.get_width(), self.back_icon.get_height())
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.pos, (self.width, self.height))
+
+    def invalidate(self):
+        """Force a full rebuild (e.g. after the display mode changed)."""
+        self._chrome = self._surface = self._values = None
+
+    def surface(self, player_name, score, last_word, last_meaning):
+        values = (player_name, score, last_word, last_meaning)
+        if values != self._values:
+            self._compose(*values)
+            self._values = values
+        return self._surface
+
+    def draw(self, target, player_name, score, last_word, last_meaning):
+        """Blit the HUD; returns True when its contents changed this frame."""
+        changed = (player_name, score, last_word, last_meaning) != self._values
+        target.blit(self.surface(player_name, score, last_word, last_meaning), self.pos)
+        return changed
+
+    # ---------- internals ----------
+    def _build_chrome(self):
+        w, h, px, py = self.width, self.height, self.px, self.py
+        chrome = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(chrome, self.bg_color, (0, 0, w, h), border_radius=24)
+        pygame.draw.rect(chrome, self.border_color, (4, 4, w-8, h-8), border_radius=22, width=2)
+
+        chrome.blit(text_cache.render("Word:", 18, WORD_LABEL_COLOR), (px, py+2))
+        by = py + 70
+        chrome.blit(self.player_icon, (px, by-5))
+        self._score_label = text_cache.render("Score:", 18, self.score_label_color)
+        chrome.blit(self._score_label, (px+260, by+2))
+        chrome.blit(self.back_icon, (self.back_x, by-6))
+        self._chrome = chrome
+
+    def _wrapped_meaning(self, meaning):
+        lines = self._wrapped.get(meaning)
+        if lines is None:
+            mx = self.px + 260
+            lines = self.wrap(meaning, text_cache.get_font(18), self.width - mx - self.px)[:2]
+            if len(self._wrapped) > 256:
+                self._wrapped.clear()
+            self._wrapped[meaning] = lines
+        return lines
+
+    def _compose(self, player_name, score, last_word, last_meaning):
+        if self._chrome is None:
+            self._build_chrome()
+        # copy, not blit: alpha-blending the chrome onto a cleared surface
+        # would darken the translucent panel
+        surf = self._surface = self._chrome.copy()
+
+        render = text_cache.render
+        px, py = self.px, self.py
+
+        # top row — word + meaning
+        surf.blit(render(last_word or "-", 24, WORD_COLOR), (px+70, py))
+        for i, line in enumerate(self._wrapped_meaning(last_meaning or NO_MEANING)):
+            surf.blit(render(line, 18, MEANING_COLOR), (px+260, py + i*22))
+
+        # bottom row — player | score
+        by = py + 70
+        surf.blit(render(player_name or "-", 24, VALUE_COLOR), (px+70, by))
+        score_x = self.score_value_x
+        if score_x is None:
+            score_x = px + 260 + self._score_label.get_width() + 20
+        surf.blit(render(str(score), 24, VALUE_COLOR), (score_x, by))
+        self.recomposes += 1
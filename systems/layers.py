@@ -0,0 +1,65 @@
+# systems/layers.py
+# Static layer compositor: the background image and the board chrome (grid
+# lines, empty tiles) baked into one surface in the display's pixel format.
+#
+# The layer is rebuilt only when the window size or the board geometry key
+# changes, so a frame pays one plain blit instead of a per-pixel format
+# conversion plus a draw call per cell.
+import pygame
+
+
+def display_format(surface):
+    """`surface` converted to the display format (as-is if no display yet)."""
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class StaticLayer:
+    """
+    background: the (unscaled is fine) background surface.
+    draw_chrome(surface): draws everything static on top of it, in screen
+    coordinates. Pass the board geometry as `geometry` to draw()/surface();
+    a different value (or window size) triggers a rebuild.
+    """
+
+    def __init__(self, background, draw_chrome=None):
+        self.background = background
+        self.draw_chrome = draw_chrome
+        self._surface = None
+        self._key = None
+        self.rebuilds = 0
+
+    def invalidate(self):
+        """Force a rebuild on next use (e.g. after the display mode changed)."""
+        self._surface = self._key = None
+
+    def surface(self, size, geometry=None):
+        key = (tuple(size), geometry)
+        if self._surface is None or key != self._key:
+            self._build(tuple(size))
+            self._key = key
+        return self._surface
+
+    def draw(self, target, area=None, geometry=None):
+        """Blit the layer to `target`; only `area` of it when given."""
+        surf = self.surface(target.get_size(), geometry)
+        if area is None:
+            target.blit(surf, (0, 0))
+        else:
+            target.blit(surf, area, area)
+
+    # ---------- internals ----------
+    def _build(self, size):
+        bg = self.background
+        if bg.get_size() != size:
+            bg = pygame.transform.scale(bg, size)
+        surf = pygame.Surface(size)
+        surf.blit(bg, (0, 0))
+        surf = display_format(surf)
+        if self.draw_chrome:
+            self.draw_chrome(surf)
+        self._surface = surf
+        self.rebuilds += 1
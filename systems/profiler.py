@@ -0,0 +1,269 @@
+# systems/profiler.py
+# Frame profiler: named timing scopes, an on-screen overlay, cProfile
+# captures and CSV / Chrome trace export.
+#
+#   F3  toggle recording + overlay
+#   F4  cProfile the next CAPTURE_SECONDS, then print the top functions
+#   F5  export the recorded frames (CSV + Chrome trace JSON)
+#
+# Recording also starts at launch with SPELLOVERSE_PROFILE=1. While it is
+# off, scope() hands back one shared no-op context manager and end_frame()
+# returns at once, so instrumented loops cost next to nothing.
+import os, time, json, csv, cProfile, pstats, io
+from collections import deque
+import pygame
+from systems import text_cache, frame_pacer, assets
+
+HISTORY_FRAMES = 600        # frames kept for the overlay and exports
+CAPTURE_SECONDS = 5.0
+OUTPUT_DIR = "profiles"
+OVERLAY_REFRESH = 0.25      # seconds between overlay redraws
+OVERLAY_POS = (10, 10)
+DROPPED_FACTOR = 1.5        # a frame longer than 1.5x its budget counts as dropped
+
+TOGGLE_KEY = pygame.K_F3
+CAPTURE_KEY = pygame.K_F4
+EXPORT_KEY = pygame.K_F5
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler, self.name = profiler, name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.profiler._scopes.append((self.name, self.start, end - self.start))
+        return False
+
+
+class FrameProfiler:
+    """
+    Usage per frame:
+        with profiler.scope("events"): ...
+        with profiler.scope("draw"): ...
+        profiler.end_frame("mode1", FPS)
+
+    A frame is the wall time between two end_frame() calls, so it includes
+    the clock.tick() wait; the scopes show where the busy part went.
+    """
+
+    def __init__(self, history=HISTORY_FRAMES, enabled=False):
+        self.enabled = enabled
+        self._frames = deque(maxlen=history)   # (screen, start, duration, fps, [(scope, start, duration)])
+        self._scopes = []
+        self._last_end = None
+        self._capture = None
+        self._capture_until = 0.0
+        self._overlay = None
+        self._overlay_time = 0.0
+        self.overlay_version = 0
+
+    # ---------- recording ----------
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def end_frame(self, screen="", fps=60):
+        if self._capture is not None and time.perf_counter() >= self._capture_until:
+            self._finish_capture()
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_end is not None:
+            self._frames.append((screen, self._last_end, now - self._last_end, fps, self._scopes))
+        self._scopes = []
+        self._last_end = now
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._scopes = []
+        self._last_end = None
+        self._overlay = None
+        self.overlay_version += 1
+
+    def reset(self):
+        self._frames.clear()
+        self._scopes = []
+        self._last_end = None
+
+    # ---------- hotkeys ----------
+    def handle_event(self, event):
+        """Profiler hotkeys; returns True when the event was one of them."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == TOGGLE_KEY:
+            self.set_enabled(not self.enabled)
+        elif event.key == CAPTURE_KEY:
+            self.start_capture()
+        elif event.key == EXPORT_KEY:
+            self.export()
+        else:
+            return False
+        return True
+
+    # ---------- stats ----------
+    def stats(self):
+        """Frame time percentiles, dropped frames and mean ms per scope."""
+        frames = list(self._frames)
+        if not frames:
+            return {"frames": 0, "screen": "", "frame_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0,
+                    "dropped": 0, "scopes": {}}
+        times = sorted(f[2] * 1000 for f in frames)
+        pick = lambda q: times[min(len(times) - 1, int(q * len(times)))]
+        dropped = sum(1 for f in frames if f[2] > DROPPED_FACTOR / f[3])
+        totals = {}
+        for f in frames:
+            for name, _, duration in f[4]:
+                totals[name] = totals.get(name, 0.0) + duration
+        return {
+            "frames": len(frames),
+            "screen": frames[-1][0],
+            "frame_ms": sum(times) / len(times),
+            "p50_ms": pick(0.50),
+            "p99_ms": pick(0.99),
+            "dropped": dropped,
+            "scopes": {k: v * 1000 / len(frames) for k, v in totals.items()},
+        }
+
+    # ---------- overlay ----------
+    @property
+    def overlay_rect(self):
+        """Screen area of the overlay (empty while recording is off)."""
+        if not self.enabled or self._overlay is None:
+            return pygame.Rect(0, 0, 0, 0)
+        return self._overlay.get_rect(topleft=OVERLAY_POS)
+
+    def overlay_state(self):
+        """(version, rect) of the overlay, re-rendered when due; for dirty-rect tracking."""
+        if self.enabled:
+            now = time.perf_counter()
+            if self._overlay is None or now - self._overlay_time >= OVERLAY_REFRESH:
+                self._overlay = self._render_overlay()
+                self._overlay_time = now
+                self.overlay_version += 1
+        return self.overlay_version, self.overlay_rect
+
+    def draw_overlay(self, target):
+        if not self.enabled:
+            return
+        self.overlay_state()
+        target.blit(self._overlay, OVERLAY_POS)
+
+    def _render_overlay(self):
+        s = self.stats()
+        lines = [
+            f"{s['screen'] or '-'}  frame {s['frame_ms']:.1f} ms",
+            f"p50 {s['p50_ms']:.1f}  p99 {s['p99_ms']:.1f}  dropped {s['dropped']}/{s['frames']}",
+        ]
+        for name, ms in sorted(s["scopes"].items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {name:<8} {ms:6.2f} ms")
+        cpu = frame_pacer.cpu_percent(s["screen"])
+        if cpu is not None:
+            lines.append(f"  cpu      {cpu:5.1f} %")
+        lines.append(f"  assets   {assets.memory_report()['total_bytes'] / 2**20:5.1f} MB")
+        if self._capture is not None:
+            lines.append("  cProfile capture running")
+
+        font = text_cache.get_font(14)
+        rendered = [font.render(line, True, (230, 255, 230)) for line in lines]
+        w = max(r.get_width() for r in rendered) + 16
+        h = sum(r.get_height() for r in rendered) + 12
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        y = 6
+        for r in rendered:
+            panel.blit(r, (8, y))
+            y += r.get_height()
+        return panel
+
+    # ---------- cProfile ----------
+    def start_capture(self, seconds=CAPTURE_SECONDS):
+        if self._capture is not None:
+            return
+        print(f"Profiling the next {seconds:.0f}s…")
+        self._capture = cProfile.Profile()
+        self._capture_until = time.perf_counter() + seconds
+        self._capture.enable()
+
+    def _finish_capture(self):
+        capture, self._capture = self._capture, None
+        capture.disable()
+        path = self._output_path("capture", "prof")
+        capture.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(capture, stream=out).sort_stats("cumulative").print_stats(20)
+        print(out.getvalue())
+        print("cProfile capture written to", path)
+
+    # ---------- export ----------
+    def export(self):
+        """Write the recorded frames as CSV and Chrome trace JSON; returns both paths."""
+        paths = (self.export_csv(self._output_path("frames", "csv")),
+                 self.export_chrome_trace(self._output_path("trace", "json")))
+        print("Profiler export:", *paths)
+        return paths
+
+    def export_csv(self, path):
+        """One row per frame, plus one row per scope inside it."""
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["frame", "screen", "scope", "start_ms", "duration_ms"])
+            for i, (screen, start, duration, _, scopes) in enumerate(self._frames):
+                w.writerow([i, screen, "frame", f"{start * 1000:.3f}", f"{duration * 1000:.3f}"])
+                for name, s_start, s_duration in scopes:
+                    w.writerow([i, screen, name, f"{s_start * 1000:.3f}", f"{s_duration * 1000:.3f}"])
+        return path
+
+    def export_chrome_trace(self, path):
+        """chrome://tracing / Perfetto "complete" events, in microseconds."""
+        events = []
+        for screen, start, duration, _, scopes in self._frames:
+            events.append({"name": "frame", "cat": screen, "ph": "X", "pid": 1, "tid": 1,
+                           "ts": start * 1e6, "dur": duration * 1e6})
+            for name, s_start, s_duration in scopes:
+                events.append({"name": name, "cat": screen, "ph": "X", "pid": 1, "tid": 1,
+                               "ts": s_start * 1e6, "dur": s_duration * 1e6})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    def _output_path(self, kind, ext):
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        return os.path.join(OUTPUT_DIR, f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}.{ext}")
+
+
+PROFILER = FrameProfiler(enabled=os.environ.get("SPELLOVERSE_PROFILE") == "1")
+
+def scope(name):
+    return PROFILER.scope(name)
+
+def end_frame(screen="", fps=60):
+    PROFILER.end_frame(screen, fps)
+
+def handle_event(event):
+    return PROFILER.handle_event(event)
+
+def overlay_state():
+    return PROFILER.overlay_state()
+
+def draw_overlay(target):
+    PROFILER.draw_overlay(target)
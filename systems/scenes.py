@@ -0,0 +1,165 @@
+# systems/scenes.py
+# Scene stack: one display, one clock and one event pump for the whole
+# game. Menus and game modes are Scenes that the manager pushes and pops,
+# so switching screens never re-creates the window or re-inits pygame.
+import traceback
+import pygame
+from systems import profiler, assets, frame_pacer
+from systems.frame_pacer import FramePacer
+
+
+class Scene:
+    """
+    Override what the screen needs:
+        enter()              pushed onto the stack (the display is ready)
+        exit()               popped, replaced, or the game is quitting
+        pause() / resume()   another scene was pushed on top / popped off
+        handle_event(event)  one event from the shared pump
+        update()             advance state once per frame
+        draw(surface)        draw and present the frame (skip it if unchanged)
+        preload()            loaders for assets of scenes reachable from here
+
+    `manager` and `pacer` are set when the scene is pushed. A scene leaves
+    with self.manager.pop(); window close ends every scene via exit().
+    An exception from a frame propagates out of run() unless the scene sets
+    catch_errors, in which case it is reported and the scene is popped.
+    """
+    name = "scene"
+    fps = 60
+    caption = None
+    catch_errors = False
+
+    def __init__(self):
+        self.manager = None
+        self.pacer = None
+
+    def enter(self): pass
+    def exit(self): pass
+    def pause(self): pass
+
+    def resume(self):
+        self.pacer.invalidate()
+
+    def handle_event(self, event): pass
+    def update(self): pass
+    def draw(self, surface): pass
+
+    def preload(self):
+        return ()
+
+
+class SceneManager:
+    """Owns the pygame session, display surface and clock; runs the top scene."""
+
+    def __init__(self, size, caption=""):
+        pygame.init()
+        self.display = pygame.display.set_mode(size)
+        self.caption = caption
+        pygame.display.set_caption(caption)
+        self.clock = pygame.time.Clock()
+        self._stack = []
+
+    @property
+    def top(self):
+        return self._stack[-1] if self._stack else None
+
+    def __len__(self):
+        return len(self._stack)
+
+    # ---------- stack ----------
+    def push(self, scene):
+        if self._stack:
+            self._stack[-1].pause()
+        scene.manager = self
+        scene.pacer = FramePacer(scene.fps, self.clock)
+        self._stack.append(scene)
+        self._set_caption(scene)
+        try:
+            scene.enter()
+        except Exception as e:
+            print("Failed entering scene:", scene.name, e)
+            traceback.print_exc()
+            self._stack.remove(scene)
+            if self._stack:
+                self._set_caption(self.top)
+                self.top.resume()
+            return None
+        loaders = scene.preload()
+        if loaders:
+            assets.preload_async(*loaders)
+        return scene
+
+    def pop(self, scene=None):
+        """Remove the top scene (or `scene`, wherever it is) and resume the one below."""
+        scene = scene or self.top
+        if scene not in self._stack:
+            return
+        was_top = scene is self.top
+        self._stack.remove(scene)
+        self._exit(scene)
+        if was_top and self._stack:
+            self._set_caption(self.top)
+            self.top.resume()
+
+    def replace(self, scene, new_scene):
+        """Swap `scene` for `new_scene` without resuming the scene below."""
+        if scene in self._stack:
+            self._stack.remove(scene)
+            self._exit(scene)
+        return self.push(new_scene)
+
+    def quit(self):
+        """Exit every scene, top first; run() returns afterwards."""
+        while self._stack:
+            self._exit(self._stack.pop())
+
+    def _exit(self, scene):
+        """exit() that cannot take the game down (it also runs while a failed scene is removed)."""
+        try:
+            scene.exit()
+        except Exception as e:
+            print("Failed exiting scene:", scene.name, e)
+
+    def _set_caption(self, scene):
+        pygame.display.set_caption(scene.caption or self.caption)
+
+    # ---------- loop ----------
+    def run(self, scene=None):
+        """Run until the stack is empty."""
+        if scene is not None:
+            self.push(scene)
+        while self._stack:
+            self.step()
+
+    def step(self):
+        """One frame of the top scene; a catch_errors scene that raises is reported and popped."""
+        scene = self.top
+        try:
+            self._step(scene)
+        except Exception as e:
+            failed = self.top or scene
+            if not failed.catch_errors:
+                raise
+            print("Scene failed:", failed.name, e)
+            traceback.print_exc()
+            self.pop(failed)
+
+    def _step(self, scene):
+        with profiler.scope("events"):
+            for event in frame_pacer.get_events():
+                if profiler.handle_event(event):
+                    continue
+                if event.type == pygame.QUIT:
+                    self.quit()
+                    return
+                if self.top is None:
+                    return
+                self.top.handle_event(event)
+        if self.top is not scene:
+            return      # the new top scene starts on the next frame
+        scene.update()
+        if self.top is not scene:
+            return
+        scene.draw(self.display)
+        scene.pacer.wait(scene.name)
+        profiler.end_frame(scene.name, scene.fps)
@@ -0,0 +1,91 @@
+# systems/score_writer.py
+# Write-behind high score persistence: gameplay submits scores, a background
+# thread writes them to SQLite, so the render loop never waits on a commit.
+import threading, atexit
+from systems import db_manager
+
+FLUSH_INTERVAL = 2.0  # seconds between background flushes
+
+
+class ScoreWriter:
+    """
+    Coalesces score submissions per (player, mode), keeping only the max,
+    and writes them in one transaction per flush.
+    """
+
+    def __init__(self, interval=FLUSH_INTERVAL):
+        self.interval = interval
+        self._pending = {}            # (name, mode) -> best score not yet written
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()   # one flush (swap + commit) at a time
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def submit(self, name, score, mode="mode1"):
+        """Queue a score; returns immediately."""
+        if not name:
+            return
+        if mode not in ("mode1", "mode2"):
+            raise ValueError("mode must be 'mode1' or 'mode2'")
+        key = (name, mode)
+        with self._lock:
+            if score > self._pending.get(key, float("-inf")):
+                self._pending[key] = score
+            if self._thread is None and not self._stopping:
+                self._thread = threading.Thread(target=self._run, name="score-writer", daemon=True)
+                self._thread.start()
+
+    def flush(self):
+        """
+        Write everything pending now, on the calling thread. Waits for a
+        flush already in progress, so every score submitted before the call
+        is written (or kept for a retry) when it returns.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                with db_manager.transaction():
+                    for (name, mode), score in batch.items():
+                        db_manager.update_high_score(name, score, mode=mode)
+            except Exception as e:
+                print("Score flush error:", e)
+                # keep the batch for the next flush, merged with newer submissions
+                with self._lock:
+                    for key, score in batch.items():
+                        if score > self._pending.get(key, float("-inf")):
+                            self._pending[key] = score
+
+    def close(self):
+        """Stop the worker and do a final flush. Safe to call more than once."""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout=2.0)
+        self.flush()
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+
+_writer = ScoreWriter()
+
+def submit_score(name, score, mode="mode1"):
+    _writer.submit(name, score, mode)
+
+def flush_scores():
+    _writer.flush()
+
+def shutdown():
+    _writer.close()
+
+# final flush on interpreter exit (runs before db_manager closes its connections)
+atexit.register(shutdown)
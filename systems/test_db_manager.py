@@ -0,0 +1,75 @@
+# systems/test_db_manager.py
+# Run with:  python -m pytest systems/test_db_manager.py
+import sys, os, sqlite3
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from systems import db_manager
+
+# every query the game runs per move / per frame / per menu visit
+HOT_QUERIES = {
+    "word bucket":       ("SELECT id FROM words WHERE length=?", (5,)),
+    "word by id":        ("SELECT * FROM words WHERE id=?", (1,)),
+    "word lookup":       ("SELECT * FROM words WHERE word = ?", ("CAT",)),
+    "player score":      ("SELECT mode1_high_score FROM players WHERE name=?", ("a",)),
+    "all players":       ("SELECT * FROM players ORDER BY name ASC", ()),
+    "leaderboard mode1": ("SELECT name, mode1_high_score FROM players ORDER BY mode1_high_score DESC LIMIT ?", (10,)),
+    "leaderboard mode2": ("SELECT name, mode2_high_score FROM players ORDER BY mode2_high_score DESC LIMIT ?", (10,)),
+}
+
+
+def _plan(sql, params):
+    with db_manager.connection() as conn:
+        return [r["detail"] for r in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_queries_use_indexes(fresh_db, name):
+    sql, params = HOT_QUERIES[name]
+    for detail in _plan(sql, params):
+        assert "TEMP B-TREE" not in detail, (name, detail)
+        if detail.startswith("SCAN"):
+            assert "USING" in detail and "INDEX" in detail, (name, detail)
+
+
+def test_migrations_run_once(fresh_db):
+    assert db_manager.schema_version() == db_manager.SCHEMA_VERSION
+    calls = []
+    db_manager.MIGRATIONS.append(lambda cur: calls.append(1))
+    try:
+        db_manager.init_db()
+        db_manager.init_db()
+    finally:
+        db_manager.MIGRATIONS.pop()
+    assert calls == [1]
+
+
+def test_legacy_database_is_migrated(tmp_path):
+    path = str(tmp_path / "legacy.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE players (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, "
+                 "high_score INTEGER DEFAULT 0, score_time TEXT)")
+    conn.execute("INSERT INTO players (name, high_score) VALUES ('old', 120)")
+    conn.commit(); conn.close()
+
+    old_path = db_manager.DB_PATH
+    db_manager.set_db_path(path)
+    try:
+        board = db_manager.get_leaderboard("mode1")
+        assert board[0]["name"] == "old" and board[0]["high_score"] == 120
+        assert db_manager.schema_version() == db_manager.SCHEMA_VERSION
+    finally:
+        db_manager.set_db_path(old_path, init=False)
+
+
+def test_schema_is_created_on_first_use(tmp_path):
+    path = tmp_path / "lazy.sqlite3"
+    old_path = db_manager.DB_PATH
+    db_manager.set_db_path(str(path), init=False)
+    try:
+        assert not path.exists()
+        assert db_manager.get_all_players() == []
+        assert db_manager.schema_version() == db_manager.SCHEMA_VERSION
+    finally:
+        db_manager.set_db_path(old_path, init=False)
+
@@ -0,0 +1,40 @@
+# systems/test_frame_pacer.py
+# Run with:  python -m pytest systems/test_frame_pacer.py
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+from systems import frame_pacer
+from systems.frame_pacer import FramePacer
+
+
+@pytest.fixture
+def events():
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+    pygame.event.clear()
+    yield
+    frame_pacer.get_events()
+    pygame.display.quit()
+
+
+def test_idle_wait_keeps_event_order(events):
+    pacer = FramePacer(30, idle_after=0)       # idle at once: wait() sleeps on the queue
+    posted = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 1), button=1),
+              pygame.event.Event(pygame.MOUSEMOTION, pos=(2, 2), rel=(1, 1), buttons=(1, 0, 0)),
+              pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a", scancode=4),
+              pygame.event.Event(pygame.TEXTINPUT, text="a")]
+    for event in posted:
+        pygame.event.post(event)
+    pacer.wait("test")
+    got = [e for e in frame_pacer.get_events() if e.type in {p.type for p in posted}]
+    assert [e.type for e in got] == [e.type for e in posted]
+
+
+def test_get_events_without_wait(events):
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    assert [e.type for e in frame_pacer.get_events()] == [pygame.USEREVENT]
+    assert frame_pacer.get_events() == []
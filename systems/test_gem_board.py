@@ -0,0 +1,296 @@
+# systems/test_gem_board.py
+# Run with:  python -m pytest systems/test_gem_board.py
+# Property tests: GemBoard must give exactly the results of mode1's original
+# nested-list helpers (kept below as the oracle), and the NumPy path and the
+# incremental matcher exactly the pure-Python full-scan results, on random
+# boards of many sizes, gem counts and hole densities.
+import sys, os, random, copy
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from systems import gem_board
+from systems.gem_board import GemBoard, EMPTY
+
+needs_numpy = pytest.mark.skipif(not gem_board.NUMPY_AVAILABLE, reason="NumPy not installed")
+
+SIZES = [(1, 1), (2, 5), (3, 3), (4, 7), (8, 8), (9, 6), (12, 12), (16, 16), (20, 11)]
+TRIALS = 150
+
+
+def random_board(rng, width, height):
+    kinds = rng.choice([2, 3, 4, 7])
+    holes = rng.choice([0.0, 0.1, 0.4])
+    return GemBoard(width, height, [EMPTY if rng.random() < holes else rng.randrange(kinds)
+                                    for _ in range(width * height)])
+
+
+# ---------- oracle: mode1's helpers before GemBoard ----------
+# Board = list of columns (board[x][y]); the size comes from the board
+# instead of mode1's BOARDWIDTH / BOARDHEIGHT.
+EMPTY_SPACE = -1
+ROWABOVEBOARD = "row above board"
+UP, DOWN, LEFT, RIGHT = "up", "down", "left", "right"
+
+
+def old_getGemAt(board, x, y):
+    return None if x < 0 or y < 0 or x >= len(board) or y >= len(board[0]) else board[x][y]
+
+
+def old_canMakeMove(board):
+    oneOffPatterns = (((0,1), (1,0), (2,0)),
+                      ((0,1), (1,1), (2,0)),
+                      ((0,0), (1,1), (2,0)),
+                      ((0,1), (1,0), (2,1)),
+                      ((0,0), (1,0), (2,1)),
+                      ((0,0), (1,1), (2,1)),
+                      ((0,0), (0,2), (0,3)),
+                      ((0,0), (0,1), (0,3)))
+    for x in range(len(board)):
+        for y in range(len(board[0])):
+            for pat in oneOffPatterns:
+                if (old_getGemAt(board, x+pat[0][0], y+pat[0][1]) ==
+                    old_getGemAt(board, x+pat[1][0], y+pat[1][1]) ==
+                    old_getGemAt(board, x+pat[2][0], y+pat[2][1]) != None) or \
+                   (old_getGemAt(board, x+pat[0][1], y+pat[0][0]) ==
+                    old_getGemAt(board, x+pat[1][1], y+pat[1][0]) ==
+                    old_getGemAt(board, x+pat[2][1], y+pat[2][0]) != None):
+                    return True
+    return False
+
+
+def old_pullDownAllGems(board):
+    height = len(board[0])
+    for x in range(len(board)):
+        gemsInColumn = [board[x][y] for y in range(height) if board[x][y] != EMPTY_SPACE]
+        board[x] = ([EMPTY_SPACE]*(height - len(gemsInColumn))) + gemsInColumn
+
+
+def old_getDropSlots(board, n_images):
+    boardCopy = copy.deepcopy(board)
+    old_pullDownAllGems(boardCopy)
+    dropSlots = [[] for _ in range(len(board))]
+    for x in range(len(board)):
+        for y in range(len(board[0])-1, -1, -1):
+            if boardCopy[x][y] == EMPTY_SPACE:
+                possible = list(range(n_images))
+                for ox, oy in ((0,-1),(1,0),(0,1),(-1,0)):
+                    n = old_getGemAt(boardCopy, x+ox, y+oy)
+                    if n in possible: possible.remove(n)
+                newGem = random.choice(possible)
+                boardCopy[x][y] = newGem
+                dropSlots[x].append(newGem)
+    return dropSlots
+
+
+def old_findMatchingGems(board):
+    gemsToRemove = []
+    bcopy = copy.deepcopy(board)
+    for x in range(len(board)):
+        for y in range(len(board[0])):
+            if old_getGemAt(bcopy,x,y)==old_getGemAt(bcopy,x+1,y)==old_getGemAt(bcopy,x+2,y)!=EMPTY_SPACE:
+                t=bcopy[x][y];offset=0;rem=[]
+                while old_getGemAt(bcopy,x+offset,y)==t:
+                    rem.append((x+offset,y));bcopy[x+offset][y]=EMPTY_SPACE;offset+=1
+                gemsToRemove.append(rem)
+            if old_getGemAt(bcopy,x,y)==old_getGemAt(bcopy,x,y+1)==old_getGemAt(bcopy,x,y+2)!=EMPTY_SPACE:
+                t=bcopy[x][y];offset=0;rem=[]
+                while old_getGemAt(bcopy,x,y+offset)==t:
+                    rem.append((x,y+offset));bcopy[x][y+offset]=EMPTY_SPACE;offset+=1
+                gemsToRemove.append(rem)
+    return gemsToRemove
+
+
+def old_getDroppingGems(board):
+    bcopy = copy.deepcopy(board)
+    dropping = []
+    for x in range(len(board)):
+        for y in range(len(board[0])-2, -1, -1):
+            if bcopy[x][y+1]==EMPTY_SPACE and bcopy[x][y]!=EMPTY_SPACE:
+                dropping.append({'imageNum':bcopy[x][y],'x':x,'y':y,'direction':DOWN})
+                bcopy[x][y]=EMPTY_SPACE
+    return dropping
+
+
+def old_moveGems(board, moving):
+    for g in moving:
+        if g['y']!=ROWABOVEBOARD:
+            board[g['x']][g['y']]=EMPTY_SPACE
+            dx=dy=0
+            if g['direction']==LEFT:dx=-1
+            elif g['direction']==RIGHT:dx=1
+            elif g['direction']==DOWN:dy=1
+            elif g['direction']==UP:dy=-1
+            board[g['x']+dx][g['y']+dy]=g['imageNum']
+        else:
+            board[g['x']][0]=g['imageNum']
+
+
+ORACLE_SIZES = [(3, 3), (4, 7), (8, 8), (9, 6), (12, 12)]
+
+
+@pytest.mark.parametrize("size", ORACLE_SIZES)
+def test_matches_and_moves_equal_old_helpers(size):
+    rng = random.Random(hash(size) + 10)
+    for _ in range(TRIALS):
+        board = random_board(rng, *size)
+        columns = board.to_columns()
+        assert board.find_matches_py() == old_findMatchingGems(columns)
+        assert board.find_matches() == old_findMatchingGems(columns)
+        assert board.can_make_move_py() == old_canMakeMove(columns)
+        assert board.to_columns() == columns
+
+
+@pytest.mark.parametrize("size", ORACLE_SIZES)
+def test_refill_equals_old_helpers(size):
+    rng = random.Random(hash(size) + 11)
+    for trial in range(TRIALS):
+        board = random_board(rng, *size)
+        columns = board.to_columns()
+        random.seed(trial)
+        expected = old_getDropSlots(columns, 7)
+        assert board.drop_slots(7, random.Random(trial)) == expected
+        assert [(g.x, g.y, g.image) for g in board.dropping_gems()] == \
+               [(g['x'], g['y'], g['imageNum']) for g in old_getDroppingGems(columns)]
+
+
+@pytest.mark.parametrize("size", ORACLE_SIZES)
+def test_cascade_equals_old_helpers(size):
+    """Resolve random boards the way swapAndResolve does, old and new side by side."""
+    rng = random.Random(hash(size) + 12)
+    for trial in range(30):
+        board = random_board(rng, *size)
+        columns = board.to_columns()
+        random.seed(trial)
+        new_rng = random.Random(trial)
+        for _ in range(10):
+            matches = board.find_matches()
+            assert matches == old_findMatchingGems(columns)
+            if not matches:
+                break
+            for group in matches:
+                for x, y in group:
+                    board[x, y] = EMPTY
+                    columns[x][y] = EMPTY_SPACE
+            new_slots, old_slots = board.drop_slots(4, new_rng), old_getDropSlots(columns, 4)
+            assert new_slots == old_slots
+            while old_slots != [[]] * len(columns):
+                moving, old_moving = board.dropping_gems(), old_getDroppingGems(columns)
+                for x in range(len(old_slots)):
+                    if old_slots[x]:
+                        moving.append(gem_board.MovingGem(x, gem_board.ROW_ABOVE, new_slots[x].pop(0)))
+                        old_moving.append({'imageNum': old_slots[x].pop(0), 'x': x,
+                                           'y': ROWABOVEBOARD, 'direction': DOWN})
+                board.apply_moves(moving)
+                old_moveGems(columns, old_moving)
+                assert board.to_columns() == columns
+        assert board.can_make_move() == old_canMakeMove(columns)
+
+
+@needs_numpy
+@pytest.mark.parametrize("size", SIZES)
+def test_find_matches_np_matches_python(size):
+    rng = random.Random(hash(size))
+    for _ in range(TRIALS):
+        board = random_board(rng, *size)
+        before = board.copy()
+        assert gem_board.find_matches_np(board) == board.find_matches_py()
+        assert board == before
+
+
+@needs_numpy
+@pytest.mark.parametrize("size", SIZES)
+def test_can_make_moves_matches_python(size):
+    rng = random.Random(hash(size) + 1)
+    boards = [random_board(rng, *size) for _ in range(TRIALS)]
+    expected = [b.can_make_move_py() for b in boards]
+    assert [bool(gem_board.can_make_moves(gem_board.as_grid(b))) for b in boards] == expected
+    assert gem_board.can_make_moves(gem_board.stack_grids(boards)).tolist() == expected
+
+
+@needs_numpy
+@pytest.mark.parametrize("size", SIZES)
+def test_has_matches_batch(size):
+    rng = random.Random(hash(size) + 2)
+    boards = [random_board(rng, *size) for _ in range(TRIALS)]
+    expected = [bool(b.find_matches_py()) for b in boards]
+    assert gem_board.has_matches(gem_board.stack_grids(boards)).tolist() == expected
+
+
+@needs_numpy
+def test_full_refresh_uses_numpy_on_large_boards(monkeypatch):
+    calls = []
+    run_masks = gem_board.run_masks
+    monkeypatch.setattr(gem_board, "run_masks", lambda g: calls.append(g) or run_masks(g))
+    GemBoard(8, 8).find_matches()
+    assert not calls
+    board = GemBoard(16, 16)
+    board.find_matches()
+    assert len(calls) == 1
+    board.swap((0, 0), (0, 1))      # two dirty lines are refreshed in Python
+    board.find_matches()
+    assert len(calls) == 1
+
+
+# ---------- incremental matching ----------
+def _mutate(rng, board):
+    """One random write through the board's own API, like a turn of mode1 would make."""
+    w, h = board.width, board.height
+    op = rng.randrange(6)
+    if op == 0:
+        board[rng.randrange(w), rng.randrange(h)] = rng.randrange(-1, 4)
+    elif op == 1:
+        x, y = rng.randrange(w), rng.randrange(h)
+        dx, dy = rng.choice([(1, 0), (0, 1)])
+        if x + dx < w and y + dy < h:
+            board.swap((x, y), (x + dx, y + dy))
+    elif op == 2:
+        for group in board.find_matches():
+            for cell in group:
+                board[cell] = EMPTY
+    elif op == 3:
+        moving = board.dropping_gems()
+        x, y = rng.randrange(w), rng.randrange(h)
+        if y:       # plus one gem moving up, as swaps animate
+            moving.append(gem_board.MovingGem(x, y, board[x, y], 0, -1))
+        board.apply_moves(moving)
+    elif op == 4:
+        slots = board.drop_slots(4, rng)
+        board.gravity()
+        for x, col in enumerate(slots):
+            for k, gem in enumerate(col):
+                board[x, len(col) - 1 - k] = gem
+    else:
+        board.shuffle(rng)
+
+
+@pytest.mark.parametrize("size", [(3, 3), (8, 8), (5, 11), (16, 16)])
+def test_incremental_matches_equal_full_scan(size):
+    rng = random.Random(hash(size) + 3)
+    for _ in range(20):
+        board = random_board(rng, *size)
+        for _ in range(40):
+            _mutate(rng, board)
+            if rng.random() < 0.2:
+                board = board.copy()        # the copy carries the match state over
+            fresh = GemBoard(board.width, board.height, board.cells)
+            assert board.find_matches() == fresh.find_matches_py()
+
+
+def test_apply_moves_marks_rows_above_and_below():
+    board = GemBoard.from_columns([[0, 2, 1, 0, 1],
+                                   [1, 2, 0, 1, 0],
+                                   [0, 3, 2, 0, 1],
+                                   [1, 0, 1, 0, 0],
+                                   [0, 1, 0, 1, EMPTY]])
+    assert board.find_matches() == []
+    # (2, 2) moves up into row 1 while (4, 3) drops into row 4
+    board.apply_moves([gem_board.MovingGem(4, 3, 1, 0, 1), gem_board.MovingGem(2, 2, 2, 0, -1)])
+    assert board.find_matches() == [[(0, 1), (1, 1), (2, 1)]]
+
+
+def test_invalidate_after_direct_writes():
+    board = GemBoard(5, 5, [0, 1] * 12 + [0])
+    assert board.find_matches() == []
+    board.cells[:3] = gem_board.array("b", [2, 2, 2])
+    board.invalidate()
+    assert board.find_matches() == [[(0, 0), (0, 1), (0, 2)]]
@@ -0,0 +1,70 @@
+# systems/test_scenes.py
+# Run with:  python -m pytest systems/test_scenes.py
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+from systems.scenes import Scene, SceneManager
+
+
+class Broken(Scene):
+    name = "broken"
+    catch_errors = True
+
+    def __init__(self, fail_update=True):
+        super().__init__()
+        self.fail_update = fail_update
+        self.exits = 0
+
+    def update(self):
+        if self.fail_update:
+            raise RuntimeError("update failed")
+
+    def exit(self):
+        self.exits += 1
+        raise RuntimeError("exit failed")
+
+
+class Quitter(Scene):
+    name = "quitter"
+
+    def update(self):
+        self.manager.pop()
+
+
+@pytest.fixture
+def manager():
+    m = SceneManager((10, 10))
+    yield m
+    pygame.quit()
+
+
+def test_failing_exit_does_not_escape_run(manager):
+    below, broken = Quitter(), Broken()
+    manager.push(below)
+    manager.push(broken)
+    manager.run()                   # broken fails, is popped (exit raises too), below quits
+    assert broken.exits == 1
+    assert len(manager) == 0
+
+
+def test_quit_exits_every_scene_even_if_one_fails(manager):
+    first, second = Broken(fail_update=False), Broken(fail_update=False)
+    manager.push(first)
+    manager.push(second)
+    manager.quit()
+    assert (first.exits, second.exits) == (1, 1)
+    assert len(manager) == 0
+
+
+def test_errors_propagate_unless_the_scene_catches_them(manager):
+    class Buggy(Scene):
+        def update(self):
+            raise RuntimeError("bug")
+
+    manager.push(Buggy())
+    with pytest.raises(RuntimeError, match="bug"):
+        manager.run()
@@ -0,0 +1,70 @@
+# systems/test_score_writer.py
+# Run with:  python -m pytest systems/test_score_writer.py
+import sys, os, threading, sqlite3
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from systems import db_manager
+from systems.score_writer import ScoreWriter
+
+
+@pytest.fixture
+def writer(fresh_db):
+    db_manager.add_player("a")
+    w = ScoreWriter(interval=60)              # background flushes stay out of the way
+    yield w
+    w.close()
+
+
+def _score(name):
+    with db_manager.connection() as conn:
+        return conn.execute("SELECT mode1_high_score FROM players WHERE name=?", (name,)).fetchone()[0]
+
+
+def test_failed_flush_is_retried(writer, monkeypatch):
+    writer.submit("a", 50)
+    real_update = db_manager.update_high_score
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(db_manager, "update_high_score", locked)
+    writer.flush()
+    assert not _score("a")                    # nothing written yet
+    writer.submit("a", 40)                    # a lower score submitted after the failure
+    monkeypatch.setattr(db_manager, "update_high_score", real_update)
+    writer.flush()
+    assert _score("a") == 50                  # the failed batch was kept and merged
+
+
+def test_flush_waits_for_a_flush_in_progress(writer, monkeypatch):
+    writer.submit("a", 70)
+    started, release = threading.Event(), threading.Event()
+    real_update = db_manager.update_high_score
+
+    def slow(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        real_update(*args, **kwargs)
+
+    monkeypatch.setattr(db_manager, "update_high_score", slow)
+    first = threading.Thread(target=writer.flush)
+    first.start()
+    assert started.wait(5)
+    done = threading.Event()
+    threading.Thread(target=lambda: (writer.flush(), done.set())).start()
+    assert not done.wait(0.2)                 # the second flush waits for the commit
+    release.set()
+    assert done.wait(5)
+    assert _score("a") == 70                  # written once the second flush returns
+    first.join()
+
+
+def test_close_writes_pending_scores(writer):
+    writer.submit("a", 30)
+    writer.submit("a", 20)
+    writer.close()
+    assert _score("a") == 30
+    writer.submit("a", 90)                    # after close: no new worker, next flush writes it
+    writer.flush()
+    assert _score("a") == 90
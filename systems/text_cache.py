@@ -0,0 +1,65 @@
+# systems/text_cache.py
+# Shared font registry + LRU cache of rendered text surfaces.
+#
+# Fonts are loaded once per (file, size); rendered text is memoized per
+# (text, size, color, ...). Returned surfaces are shared — blit them, never
+# draw on them.
+from collections import OrderedDict
+import pygame
+
+DEFAULT_FONT = "freesansbold.ttf"
+GLYPH_CACHE_SIZE = 1024
+
+_fonts = {}
+_glyphs = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "font_loads": 0, "evictions": 0}
+
+
+def get_font(size, file=DEFAULT_FONT):
+    """Font for (file, size), loaded on first use only."""
+    key = (file, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(file, size)
+        _fonts[key] = font
+        _stats["font_loads"] += 1
+    return font
+
+
+def render(text, size, color, file=DEFAULT_FONT, antialias=True, background=None):
+    """Rendered text surface, from the LRU cache when possible."""
+    key = (text, size, tuple(color), file, antialias,
+           tuple(background) if background is not None else None)
+    surf = _glyphs.get(key)
+    if surf is not None:
+        _glyphs.move_to_end(key)
+        _stats["hits"] += 1
+        return surf
+
+    _stats["misses"] += 1
+    font = get_font(size, file)
+    if background is None:
+        surf = font.render(text, antialias, color)
+    else:
+        surf = font.render(text, antialias, color, background)
+    _glyphs[key] = surf
+    if len(_glyphs) > GLYPH_CACHE_SIZE:
+        _glyphs.popitem(last=False)
+        _stats["evictions"] += 1
+    return surf
+
+
+def stats():
+    """Counters since the last reset_stats(), plus current cache sizes."""
+    return dict(_stats, glyphs=len(_glyphs), fonts=len(_fonts))
+
+
+def reset_stats():
+    for k in _stats:
+        _stats[k] = 0
+
+
+def clear():
+    """Drop every cached font and surface (e.g. after pygame.quit())."""
+    _fonts.clear()
+    _glyphs.clear()
@@ -0,0 +1,69 @@
+# systems/timeline.py
+# Non-blocking animation timeline. The game loop calls update() once per
+# frame instead of animations looping on pygame.time.delay(), so events
+# keep flowing and an animation costs at most one frame of drawing per
+# loop iteration.
+from collections import deque
+import pygame
+
+
+class Timeline:
+    """
+    Queue of animation steps. A step is a generator that yields:
+        a callable   -> draw this frame now (the whole frame is its job)
+        a number     -> hold the current frame for that many ms
+    Game-state changes between yields happen as the step advances.
+
+    skip() runs every queued step to the end at once without drawing or
+    waiting (state changes still happen); cancel() drops them unfinished.
+    Steps can check `skipping` to leave out side effects like sounds.
+    """
+
+    def __init__(self, ticks=pygame.time.get_ticks):
+        self._steps = deque()
+        self._ticks = ticks
+        self._resume_at = 0
+        self.skipping = False
+
+    @property
+    def busy(self):
+        return bool(self._steps)
+
+    def add(self, step):
+        self._steps.append(step)
+
+    def update(self):
+        """Advance by one frame; returns True when a step drew a frame."""
+        now = self._ticks()
+        if now < self._resume_at:
+            return False
+        while self._steps:
+            try:
+                item = next(self._steps[0])
+            except StopIteration:
+                self._steps.popleft()
+                continue
+            if callable(item):
+                item()
+                return True
+            if item:
+                self._resume_at = now + item
+            return False
+        return False
+
+    def skip(self):
+        """Finish every queued step now, without drawing or holding."""
+        self.skipping = True
+        try:
+            while self._steps:
+                for _ in self._steps.popleft():
+                    pass
+        finally:
+            self.skipping = False
+            self._resume_at = 0
+
+    def cancel(self):
+        """Drop every queued step unfinished."""
+        while self._steps:
+            self._steps.popleft().close()
+        self._resume_at = 0
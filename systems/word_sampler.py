@@ -0,0 +1,74 @@
+# systems/word_sampler.py
+# Constant-time random word picking, replacing ORDER BY RANDOM().
+import random, threading
+from array import array
+
+
+class WordSampler:
+    """
+    Keeps one compact id array per word length and picks ids from it in O(1).
+
+    `fetch_ids(length)` must return an iterable of word ids for that length;
+    buckets are loaded lazily and dropped by `invalidate()` whenever the
+    words table changes.
+
+    Two picking modes:
+      - uniform:  any id of the bucket, repeats allowed
+      - no_repeat ("shuffle bag"): every id once before any id repeats,
+        done as a lazy Fisher-Yates so a pick never shuffles the whole bag.
+    """
+
+    def __init__(self, fetch_ids, rng=None):
+        self._fetch_ids = fetch_ids
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._buckets = {}   # length -> array of ids
+        self._bags = {}      # length -> [array of ids, remaining count]
+
+    # ---------- cache control ----------
+    def invalidate(self, length=None):
+        """Forget cached ids (for one length, or all). Next pick reloads."""
+        with self._lock:
+            if length is None:
+                self._buckets.clear()
+                self._bags.clear()
+            else:
+                self._buckets.pop(length, None)
+                self._bags.pop(length, None)
+
+    def reset_bags(self):
+        """Start a fresh no-repeat session (e.g. when a new game begins)."""
+        with self._lock:
+            self._bags.clear()
+
+    def bucket_size(self, length):
+        with self._lock:
+            return len(self._bucket(length))
+
+    # ---------- picking ----------
+    def pick_id(self, length, no_repeat=False):
+        """Return a random word id of `length`, or None if there is none."""
+        with self._lock:
+            bucket = self._bucket(length)
+            if not bucket:
+                return None
+            if not no_repeat:
+                return bucket[self._rng.randrange(len(bucket))]
+
+            bag = self._bags.get(length)
+            if bag is None or bag[1] == 0:
+                bag = [array("q", bucket), len(bucket)]
+                self._bags[length] = bag
+            ids, remaining = bag
+            i = self._rng.randrange(remaining)
+            last = remaining - 1
+            ids[i], ids[last] = ids[last], ids[i]
+            bag[1] = last
+            return ids[last]
+
+    def _bucket(self, length):
+        bucket = self._buckets.get(length)
+        if bucket is None:
+            bucket = array("q", self._fetch_ids(length))
+            self._buckets[length] = bucket
+        return bucket